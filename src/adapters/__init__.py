@@ -4,4 +4,5 @@ __all__ = [
     "GoogleDriveAdapter",
     "OpenAIAdapter",
     "CacheAdapter",
+    "SemanticCacheAdapter",
 ]
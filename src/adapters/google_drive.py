@@ -1,20 +1,104 @@
 """Google Drive API adapter."""
 
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
 import io
 import logging
-from typing import List, Optional
-
-import pandas as pd
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from tenacity import (
+    before_sleep_log,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 
 from src.config import settings
 from src.domain.exceptions import GoogleDriveError
 from src.domain.models import FileInfo
 
+if TYPE_CHECKING:
+    import httpx
+    import pandas as pd
+
+# Heavy third-party modules (pandas, httpx, google-api-python-client) are
+# imported where they are used, so the CLI menu appears without paying for them.
+EXCEL_ENGINE = "calamine" if importlib.util.find_spec("python_calamine") else "openpyxl"
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger(__name__)
 
+XLSX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+CSV_MIME_TYPE = "text/csv"
+DRIVE_API_URL = "https://www.googleapis.com"
+FILES_URL = "/drive/v3/files"
+EXPORT_URL = DRIVE_API_URL + FILES_URL + "/{file_id}/export"
+HTTP_TIMEOUT_SECONDS = 60.0
+MAX_CONCURRENT_DOWNLOADS = 8
+LIST_CACHE_TTL_SECONDS = 30
+# Largest page the Drive files.list endpoint accepts
+LIST_PAGE_SIZE = 1000
+# Most calls the Drive API accepts in one batch request
+BATCH_MAX_REQUESTS = 100
+FILE_INFO_FIELDS = "id, name, mimeType, modifiedTime, size"
+# Transient Drive failures are retried with jittered exponential backoff
+MAX_ATTEMPTS = 6
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+# Drive reports per-user quota exhaustion as 403 with one of these reasons
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """
+    Return True for Drive errors worth retrying: rate limits, 5xx and network errors.
+
+    Covers httpx errors from the REST calls and googleapiclient HttpErrors
+    from batch requests.
+    """
+    import httpx
+    from googleapiclient.errors import HttpError
+
+    if isinstance(exc, (httpx.TransportError, ConnectionError, TimeoutError)):
+        return True
+
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        try:
+            errors = exc.response.json()["error"]["errors"]
+        except (ValueError, KeyError, TypeError):
+            errors = []
+    elif isinstance(exc, HttpError):
+        status = exc.resp.status
+        errors = exc.error_details if isinstance(exc.error_details, list) else []
+    else:
+        return False
+
+    if status in RETRY_STATUS_CODES:
+        return True
+    if status == 403:
+        return any(
+            isinstance(error, dict) and error.get("reason") in RATE_LIMIT_REASONS
+            for error in errors
+        )
+    return False
+
+
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(MAX_ATTEMPTS),
+    before_sleep=before_sleep_log(logger, logging.WARNING),
+    reraise=True,
+)
+
 
 class GoogleDriveAdapter:
     """Adapter for Google Drive API operations."""
@@ -23,11 +107,21 @@ class GoogleDriveAdapter:
         """Initialize Google Drive API client."""
         self.creds = None
         self.service = None
+        self._cache_dir = Path(settings.cache_dir) / "sheets"
+        # (fetched_at, folder_id, files) of the most recent listing
+        self._list_cache: Optional[Tuple[float, Optional[str], List[FileInfo]]] = None
+        # Shared connection for listing and export calls, opened on first use.
+        # The lock keeps concurrent API requests from opening one client each.
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
         self._initialize()
 
     def _initialize(self):
         """Initialize Google Drive API with service account credentials."""
         try:
+            from google.oauth2 import service_account
+            from googleapiclient.discovery import build
+
             creds_dict = settings.get_credentials_dict()
 
             self.creds = service_account.Credentials.from_service_account_info(
@@ -43,7 +137,10 @@ class GoogleDriveAdapter:
 
     def list_spreadsheets(self, folder_id: Optional[str] = None) -> List[FileInfo]:
         """
-        List all Google Sheets in a folder or root.
+        List all Google Sheets in a folder or root, following every result page.
+
+        The most recent listing is reused for LIST_CACHE_TTL_SECONDS, so menu
+        actions that list right after each other cost one Drive call.
 
         Args:
             folder_id: Optional folder ID to limit results
@@ -54,38 +151,64 @@ class GoogleDriveAdapter:
         Raises:
             GoogleDriveError: If the operation fails
         """
+        if self._list_cache:
+            fetched_at, cached_folder_id, cached_files = self._list_cache
+            if (
+                cached_folder_id == folder_id
+                and time.monotonic() - fetched_at < LIST_CACHE_TTL_SECONDS
+            ):
+                logger.info(f"Reusing spreadsheet listing ({len(cached_files)} files)")
+                return list(cached_files)
+
         try:
             query = "mimeType='application/vnd.google-apps.spreadsheet' and trashed=false"
             if folder_id:
                 query += f" and '{folder_id}' in parents"
 
-            results = (
-                self.service.files()
-                .list(
-                    q=query,
-                    pageSize=50,
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime, size)",
-                    orderBy="modifiedTime desc",
-                )
-                .execute()
-            )
+            params = {
+                "q": query,
+                "pageSize": LIST_PAGE_SIZE,
+                "fields": "nextPageToken, files(id, name, mimeType, modifiedTime)",
+                "orderBy": "modifiedTime desc",
+            }
+
+            files: List[dict] = []
+            page_token = None
+            while True:
+                if page_token:
+                    params["pageToken"] = page_token
+                results = self._get(FILES_URL, params).json()
+                files.extend(results.get("files", []))
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
 
-            files = results.get("files", [])
             logger.info(f"Found {len(files)} spreadsheets")
 
-            return [FileInfo(**file) for file in files]
+            spreadsheets = [FileInfo(**file) for file in files]
+            self._list_cache = (time.monotonic(), folder_id, spreadsheets)
+            return list(spreadsheets)
 
         except Exception as e:
             logger.error(f"Error listing spreadsheets: {str(e)}")
             raise GoogleDriveError(f"Failed to list spreadsheets: {str(e)}") from e
 
-    def read_spreadsheet(self, file_id: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
+    def read_spreadsheet(
+        self,
+        file_id: str,
+        sheet_name: Optional[str] = None,
+        modified_time: Optional[str] = None,
+    ) -> pd.DataFrame:
         """
         Read a Google Sheet and return as pandas DataFrame.
 
+        When modified_time is given, the parsed DataFrame is cached on disk and
+        reused until the file changes on Drive.
+
         Args:
             file_id: Google Sheet file ID
             sheet_name: Optional specific sheet name
+            modified_time: Optional file modifiedTime (from list_spreadsheets)
 
         Returns:
             pandas DataFrame
@@ -93,39 +216,484 @@ class GoogleDriveAdapter:
         Raises:
             GoogleDriveError: If the operation fails
         """
+        cached = self._get_cached_sheet(file_id, sheet_name, modified_time)
+        if cached is not None:
+            return cached
+
         try:
             logger.info(f"Reading spreadsheet with ID: {file_id}")
 
-            # Export the Google Sheet as Excel
-            request = self.service.files().export_media(
-                fileId=file_id,
-                mimeType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            # Export the Google Sheet (CSV for the first tab, Excel for a named tab)
+            mime_type = self._export_mime_type(sheet_name)
+            response = self._get(EXPORT_URL.format(file_id=file_id), {"mimeType": mime_type})
+
+            # Read the export into a pandas DataFrame
+            try:
+                df = self._parse_export(response.content, sheet_name, mime_type)
+            except ValueError as e:
+                if mime_type != CSV_MIME_TYPE:
+                    raise
+                logger.warning(f"Could not parse CSV export, retrying as XLSX: {str(e)}")
+                response = self._get(
+                    EXPORT_URL.format(file_id=file_id), {"mimeType": XLSX_MIME_TYPE}
+                )
+                df = self._parse_export(response.content, sheet_name, XLSX_MIME_TYPE)
+
+            logger.info(f"Successfully loaded spreadsheet with shape: {df.shape}")
+            self._set_cached_sheet(file_id, sheet_name, modified_time, df)
+            return df
+
+        except Exception as e:
+            logger.error(f"Error reading spreadsheet: {str(e)}")
+            raise GoogleDriveError(f"Failed to read spreadsheet: {str(e)}") from e
+
+    async def aread_spreadsheet(
+        self,
+        file_id: str,
+        sheet_name: Optional[str] = None,
+        modified_time: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """
+        Read a Google Sheet without blocking the event loop.
+
+        Args:
+            file_id: Google Sheet file ID
+            sheet_name: Optional specific sheet name
+            modified_time: Optional file modifiedTime, enables the on-disk cache
+
+        Returns:
+            pandas DataFrame
+
+        Raises:
+            GoogleDriveError: If the operation fails
+        """
+        import httpx
+
+        token = self._access_token()
+        async with httpx.AsyncClient(http2=HTTP2_ENABLED) as client:
+            return await self._aread_spreadsheet(client, token, file_id, sheet_name, modified_time)
+
+    async def aread_many(
+        self,
+        file_ids: List[str],
+        sheet_name: Optional[str] = None,
+        modified_times: Optional[List[Optional[str]]] = None,
+        return_exceptions: bool = False,
+    ) -> List[Union[pd.DataFrame, Exception]]:
+        """
+        Read several Google Sheets concurrently.
+
+        At most MAX_CONCURRENT_DOWNLOADS exports are in flight at once to stay
+        within the Drive API quota.
+
+        Args:
+            file_ids: Google Sheet file IDs
+            sheet_name: Optional specific sheet name
+            modified_times: Optional modifiedTime per file, enables the on-disk cache
+            return_exceptions: Return the error of a failed read in place of its
+                DataFrame instead of raising it
+
+        Returns:
+            pandas DataFrames, in the same order as the file IDs
+
+        Raises:
+            GoogleDriveError: If any of the reads fails and return_exceptions is False
+        """
+        import httpx
+
+        token = self._access_token()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        modified_times = modified_times or [None] * len(file_ids)
+
+        async with httpx.AsyncClient(http2=HTTP2_ENABLED) as client:
+
+            async def read(file_id: str, modified_time: Optional[str]) -> pd.DataFrame:
+                async with semaphore:
+                    return await self._aread_spreadsheet(
+                        client, token, file_id, sheet_name, modified_time
+                    )
+
+            return list(
+                await asyncio.gather(
+                    *(read(f, m) for f, m in zip(file_ids, modified_times, strict=True)),
+                    return_exceptions=return_exceptions,
+                )
             )
 
-            # Download the file
-            fh = io.BytesIO()
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
-                if status:
-                    logger.info(f"Download progress: {int(status.progress() * 100)}%")
+    async def _aread_spreadsheet(
+        self,
+        client: httpx.AsyncClient,
+        token: str,
+        file_id: str,
+        sheet_name: Optional[str],
+        modified_time: Optional[str],
+    ) -> pd.DataFrame:
+        """
+        Export a Google Sheet over the given HTTP client and parse it.
+
+        Parquet cache reads and writes, like parsing, run in a worker thread so
+        they do not stall the other downloads on the event loop.
+        """
+        cached = await asyncio.to_thread(self._get_cached_sheet, file_id, sheet_name, modified_time)
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info(f"Reading spreadsheet with ID: {file_id}")
 
-            # Read the Excel file into a pandas DataFrame
-            fh.seek(0)
-            df = pd.read_excel(fh, engine="openpyxl", sheet_name=sheet_name)
+            mime_type = self._export_mime_type(sheet_name)
+            response = await self._aget(
+                client, token, EXPORT_URL.format(file_id=file_id), {"mimeType": mime_type}
+            )
 
-            if isinstance(df, dict):
-                # Multiple sheets - return the first one or specified sheet
-                df = df[list(df.keys())[0]] if not sheet_name else df[sheet_name]
+            try:
+                df = await asyncio.to_thread(
+                    self._parse_export, response.content, sheet_name, mime_type
+                )
+            except ValueError as e:
+                if mime_type != CSV_MIME_TYPE:
+                    raise
+                logger.warning(f"Could not parse CSV export, retrying as XLSX: {str(e)}")
+                response = await self._aget(
+                    client, token, EXPORT_URL.format(file_id=file_id), {"mimeType": XLSX_MIME_TYPE}
+                )
+                df = await asyncio.to_thread(
+                    self._parse_export, response.content, sheet_name, XLSX_MIME_TYPE
+                )
 
             logger.info(f"Successfully loaded spreadsheet with shape: {df.shape}")
+            await asyncio.to_thread(self._set_cached_sheet, file_id, sheet_name, modified_time, df)
             return df
 
         except Exception as e:
             logger.error(f"Error reading spreadsheet: {str(e)}")
             raise GoogleDriveError(f"Failed to read spreadsheet: {str(e)}") from e
 
+    @staticmethod
+    def _sheet_cache_prefix(file_id: str, sheet_name: Optional[str]) -> str:
+        """Return the cache file name prefix shared by all revisions of a sheet."""
+        return hashlib.md5(f"{file_id}:{sheet_name}".encode()).hexdigest()
+
+    def _sheet_cache_path(
+        self, file_id: str, sheet_name: Optional[str], modified_time: str
+    ) -> Path:
+        """Return the on-disk cache path for a given file revision and export format."""
+        # The export format changes the parsed dtypes, so it is part of the revision
+        revision = hashlib.md5(
+            f"{modified_time}:{self._export_mime_type(sheet_name)}".encode()
+        ).hexdigest()
+        return (
+            self._cache_dir / f"{self._sheet_cache_prefix(file_id, sheet_name)}-{revision}.parquet"
+        )
+
+    def _get_cached_sheet(
+        self, file_id: str, sheet_name: Optional[str], modified_time: Optional[str]
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a previously parsed sheet from the on-disk cache.
+
+        Returns:
+            Cached DataFrame, or None on a miss or when modified_time is unknown
+        """
+        if not modified_time:
+            return None
+
+        try:
+            import pandas as pd
+
+            cache_file = self._sheet_cache_path(file_id, sheet_name, modified_time)
+            if cache_file.exists():
+                logger.info(f"Sheet cache hit for file: {file_id}")
+                # Keep the Arrow-backed dtypes produced by _parse_export
+                return pd.read_parquet(cache_file, dtype_backend="pyarrow")
+            return None
+
+        except Exception as e:
+            logger.warning(f"Error reading sheet cache: {str(e)}")
+            return None
+
+    def _set_cached_sheet(
+        self,
+        file_id: str,
+        sheet_name: Optional[str],
+        modified_time: Optional[str],
+        df: pd.DataFrame,
+    ) -> None:
+        """Store a parsed sheet in the on-disk cache, if modified_time is known."""
+        if not modified_time:
+            return
+
+        try:
+            cache_file = self._sheet_cache_path(file_id, sheet_name, modified_time)
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(cache_file)
+
+            # Only the latest revision of a sheet is worth keeping
+            prefix = self._sheet_cache_prefix(file_id, sheet_name)
+            for stale in self._cache_dir.glob(f"{prefix}-*.parquet"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+
+        except Exception as e:
+            # e.g. non-string column names, which Parquet cannot store
+            logger.warning(f"Error writing sheet cache: {str(e)}")
+
+    def clear_sheet_cache(self) -> int:
+        """
+        Delete every cached sheet.
+
+        Returns:
+            Number of cached sheets deleted
+        """
+        try:
+            count = 0
+            for cache_file in self._cache_dir.glob("*.parquet"):
+                cache_file.unlink(missing_ok=True)
+                count += 1
+
+            logger.info(f"Cleared {count} cached sheets")
+            return count
+
+        except Exception as e:
+            logger.error(f"Error clearing sheet cache: {str(e)}")
+            return 0
+
+    @_retry_transient
+    def _get(self, url: str, params: dict) -> httpx.Response:
+        """
+        Send an authorized GET to the Drive REST API over the shared connection.
+
+        Rate limits, 5xx responses and network errors are retried (see _retry_transient).
+
+        Args:
+            url: Path relative to DRIVE_API_URL, or an absolute URL
+            params: Query parameters
+
+        Returns:
+            Successful response
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        # Set per request, since the token changes whenever credentials refresh
+        headers = {"Authorization": f"Bearer {self._access_token()}"}
+        response = self._http_client().get(url, params=params, headers=headers)
+        response.raise_for_status()
+        return response
+
+    @staticmethod
+    @_retry_transient
+    async def _aget(
+        client: httpx.AsyncClient, token: str, url: str, params: dict
+    ) -> httpx.Response:
+        """
+        Async counterpart of _get, over a caller-provided client.
+
+        Raises:
+            httpx.HTTPError: If the request fails or returns an error status
+        """
+        response = await client.get(
+            url,
+            params=params,
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=HTTP_TIMEOUT_SECONDS,
+        )
+        response.raise_for_status()
+        return response
+
+    def _http_client(self) -> httpx.Client:
+        """Return the shared HTTP client, opening it on first use."""
+        client = self._http
+        if client is None:
+            with self._http_lock:
+                if self._http is None:
+                    import httpx
+
+                    self._http = httpx.Client(
+                        base_url=DRIVE_API_URL, http2=HTTP2_ENABLED, timeout=HTTP_TIMEOUT_SECONDS
+                    )
+                client = self._http
+        return client
+
+    def close(self):
+        """Close the shared HTTP connection, if one was opened."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    def _access_token(self) -> str:
+        """
+        Return a valid OAuth access token for raw HTTP calls to the Drive API.
+
+        Raises:
+            GoogleDriveError: If the credentials cannot be refreshed
+        """
+        try:
+            from google.auth.transport.requests import Request
+
+            if not self.creds.valid:
+                self.creds.refresh(Request())
+            return self.creds.token
+
+        except Exception as e:
+            logger.error(f"Error refreshing Google credentials: {str(e)}")
+            raise GoogleDriveError(f"Failed to refresh credentials: {str(e)}") from e
+
+    @staticmethod
+    def _export_mime_type(sheet_name: Optional[str] = None) -> str:
+        """
+        Pick the export format for a read.
+
+        CSV (the SHEETS_EXPORT_FORMAT default) parses fastest, but it holds
+        the cells' formatted display values: locale-formatted numbers,
+        currency, percentages and dates arrive as text. XLSX keeps the typed
+        values and is also used when a specific sheet is requested, since
+        Drive's CSV export only contains the first tab.
+
+        Args:
+            sheet_name: Optional specific sheet name
+
+        Returns:
+            MIME type to pass to the export endpoint
+        """
+        if sheet_name or settings.sheets_export_format == "xlsx":
+            return XLSX_MIME_TYPE
+        return CSV_MIME_TYPE
+
+    @classmethod
+    def _parse_export(
+        cls, data: bytes, sheet_name: Optional[str] = None, mime_type: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Parse an export produced with _export_mime_type into a DataFrame.
+
+        Columns are Arrow-backed and narrowed with _compact_dtypes.
+
+        Args:
+            data: Exported file contents
+            sheet_name: Optional specific sheet name
+            mime_type: Format of the export (defaults to _export_mime_type(sheet_name))
+
+        Returns:
+            pandas DataFrame
+
+        Raises:
+            ValueError: If a CSV export cannot be parsed (e.g. ragged rows)
+        """
+        import pandas as pd
+
+        if not data:
+            # Drive exports an empty sheet as an empty file
+            return pd.DataFrame()
+
+        # BytesIO shares an initial bytes object until it is written to or
+        # getbuffer() is called, so wrapping the response costs no copy
+        fh = io.BytesIO(data)
+        if (mime_type or cls._export_mime_type(sheet_name)) == XLSX_MIME_TYPE:
+            df = cls._parse_workbook(fh, sheet_name).convert_dtypes(dtype_backend="pyarrow")
+        else:
+            from pyarrow import csv
+
+            # pd.read_csv(engine="pyarrow") keeps blank and repeated headers as
+            # is, which mistypes columns and breaks Parquet, so rename them first
+            table = csv.read_csv(fh)
+            table = table.rename_columns(cls._unique_column_names(table.column_names))
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+
+        return cls._compact_dtypes(df)
+
+    @staticmethod
+    def _unique_column_names(names: List[str]) -> List[str]:
+        """
+        Name blank and repeated CSV headers in the pandas style.
+
+        Blank headers become "Unnamed: <position>" and repeats get a ".1",
+        ".2", ... suffix, matching the names of the XLSX (read_excel) path.
+
+        Args:
+            names: Header row as exported
+
+        Returns:
+            Unique column names, in the same order
+        """
+        counts: Dict[str, int] = {}
+        unique = []
+        for i, name in enumerate(names):
+            name = name or f"Unnamed: {i}"
+            count = counts.get(name, 0)
+            while count:
+                counts[name] = count + 1
+                name = f"{name}.{count}"
+                count = counts.get(name, 0)
+            unique.append(name)
+            counts[name] = count + 1
+        return unique
+
+    @staticmethod
+    def _compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store whole-number columns that fit in 32 bits as int32.
+
+        Spreadsheet numbers arrive as 64-bit floats or integers; narrowing them
+        halves their memory and the work of later summaries.
+
+        Args:
+            df: Arrow-backed DataFrame
+
+        Returns:
+            DataFrame with narrowed integer columns
+        """
+        import numpy as np
+
+        int32 = np.iinfo(np.int32)
+        before = df.memory_usage(deep=True).sum()
+        narrowed = {}
+
+        for col, series in df.items():
+            if series.dtype.kind not in "fi" or series.dtype.itemsize <= 4:
+                continue
+            values = series.dropna()
+            if values.empty or values.min() < int32.min or values.max() > int32.max:
+                continue
+            if series.dtype.kind == "f":
+                floats = values.to_numpy(dtype="float64")
+                if not np.array_equal(floats, np.trunc(floats)):
+                    continue
+            narrowed[col] = "int32[pyarrow]"
+
+        if not narrowed:
+            return df
+
+        df = df.astype(narrowed)
+        after = df.memory_usage(deep=True).sum()
+        logger.info(
+            f"Narrowed {len(narrowed)} columns to int32: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB"
+        )
+        return df
+
+    @staticmethod
+    def _parse_workbook(fh: io.BytesIO, sheet_name: Optional[str] = None) -> pd.DataFrame:
+        """
+        Parse an exported workbook into a DataFrame.
+
+        Args:
+            fh: Buffer holding the XLSX export
+            sheet_name: Optional specific sheet name
+
+        Returns:
+            pandas DataFrame
+        """
+        import pandas as pd
+
+        df = pd.read_excel(fh, engine=EXCEL_ENGINE, sheet_name=sheet_name)
+
+        if isinstance(df, dict):
+            # Multiple sheets - return the first one or specified sheet
+            df = df[list(df.keys())[0]] if not sheet_name else df[sheet_name]
+
+        return df
+
     def get_file_info(self, file_id: str) -> FileInfo:
         """
         Get detailed information about a file.
@@ -144,9 +712,9 @@ class GoogleDriveAdapter:
                 self.service.files()
                 .get(
                     fileId=file_id,
-                    fields="id, name, mimeType, modifiedTime, size",
+                    fields=FILE_INFO_FIELDS,
                 )
-                .execute()
+                .execute(num_retries=MAX_ATTEMPTS - 1)
             )
 
             return FileInfo(**file_info)
@@ -154,3 +722,73 @@ class GoogleDriveAdapter:
         except Exception as e:
             logger.error(f"Error getting file info: {str(e)}")
             raise GoogleDriveError(f"Failed to get file info: {str(e)}") from e
+
+    def get_file_infos(self, file_ids: List[str]) -> Dict[str, FileInfo]:
+        """
+        Get information about several files using Drive batch requests.
+
+        Up to BATCH_MAX_REQUESTS metadata lookups are sent in one HTTP round
+        trip. Lookups that fail transiently are batched again with the same
+        backoff as the other Drive calls (see _retry_transient).
+
+        Args:
+            file_ids: File IDs to get info for
+
+        Returns:
+            Mapping of file ID to FileInfo
+
+        Raises:
+            GoogleDriveError: If any lookup fails
+        """
+        unique_ids = list(dict.fromkeys(file_ids))
+        results: Dict[str, FileInfo] = {}
+        failures: Dict[str, Exception] = {}
+
+        try:
+            self._batch_file_infos(unique_ids, results, failures)
+
+        except Exception as e:
+            # Lookups that stayed failed after the retries are reported below
+            if e not in failures.values():
+                logger.error(f"Error getting file info: {str(e)}")
+                raise GoogleDriveError(f"Failed to get file info: {str(e)}") from e
+
+        if failures:
+            details = "; ".join(f"{file_id}: {error}" for file_id, error in failures.items())
+            logger.error(f"Error getting file info: {details}")
+            raise GoogleDriveError(f"Failed to get file info: {details}")
+
+        return {file_id: results[file_id] for file_id in unique_ids}
+
+    @_retry_transient
+    def _batch_file_infos(
+        self, file_ids: List[str], results: Dict[str, FileInfo], failures: Dict[str, Exception]
+    ) -> None:
+        """
+        Fetch the metadata of the files not yet in results.
+
+        Failed lookups are recorded in failures. If any of them is transient,
+        it is raised so that the retry batches the failed files again.
+        """
+        failures.clear()
+
+        def on_response(request_id: str, response: dict, exception: Optional[Exception]):
+            if exception is not None:
+                failures[request_id] = exception
+            else:
+                results[request_id] = FileInfo(**response)
+
+        pending = [file_id for file_id in file_ids if file_id not in results]
+        for start in range(0, len(pending), BATCH_MAX_REQUESTS):
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for file_id in pending[start : start + BATCH_MAX_REQUESTS]:
+                batch.add(
+                    self.service.files().get(fileId=file_id, fields=FILE_INFO_FIELDS),
+                    request_id=file_id,
+                )
+            batch.execute()
+
+        transient = [error for error in failures.values() if _is_transient(error)]
+        if transient:
+            logger.warning(f"Retrying {len(transient)} transiently failed file info lookups")
+            raise transient[0]
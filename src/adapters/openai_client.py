@@ -1,17 +1,92 @@
 """OpenAI API adapter."""
 
+from __future__ import annotations
+
+import asyncio
+import contextlib
 import json
 import logging
-from typing import Optional
-
-import pandas as pd
-from openai import OpenAI
+import threading
+import warnings
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple
 
 from src.config import settings
 from src.domain.exceptions import OpenAIError
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from openai import AsyncOpenAI
+
+# openai, pandas, numpy and pyarrow are imported where they are used to keep
+# CLI startup fast.
+
 logger = logging.getLogger(__name__)
 
+DESCRIBE_INDEX = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+EMBEDDING_MODEL = "text-embedding-3-small"
+# Retries of rate-limited, 5xx and connection-failed requests; the SDK backs
+# off exponentially with jitter and honours Retry-After
+MAX_RETRIES = 5
+# Frames larger than this get their numeric statistics from a random sample
+SUMMARY_SAMPLE_ROWS = 100_000
+# Data summaries kept for recently analyzed sheet revisions
+SUMMARY_CACHE_SIZE = 32
+
+# Static text comes first and the data last, so repeated questions about the
+# same sheet send a byte-identical system message
+SYSTEM_PROMPT_TEMPLATE = """\
+Você é um assistente especializado em análise de dados e insights de negócio. Forneça respostas claras, objetivas e acionáveis.
+
+Você é um especialista em análise de dados. Analise os dados abaixo e responda à pergunta do usuário.
+Por favor, forneça uma análise detalhada, insights relevantes e recomendações baseadas nos dados apresentados.
+Se necessário, sugira visualizações ou análises adicionais que poderiam ser úteis.
+
+DADOS:
+{data_summary}
+"""
+
+# Automatic insights are requested as independent sections sent concurrently
+INSIGHT_SECTIONS: List[Tuple[str, str]] = [
+    (
+        "Principais insights e padrões",
+        "Liste os principais insights e padrões identificados nestes dados.",
+    ),
+    (
+        "Anomalias e valores interessantes",
+        "Aponte anomalias ou valores interessantes nestes dados.",
+    ),
+    (
+        "Correlações importantes",
+        "Descreva as correlações importantes entre as colunas destes dados, se houver.",
+    ),
+    (
+        "Recomendações de ações",
+        "Recomende ações baseadas nestes dados.",
+    ),
+    (
+        "Sugestões de análises adicionais",
+        "Sugira análises adicionais que poderiam ser valiosas para estes dados.",
+    ),
+]
+INSIGHT_PROMPTS = [prompt for _, prompt in INSIGHT_SECTIONS]
+
+
+def format_insights(results: List[str]) -> str:
+    """
+    Join the answers to INSIGHT_PROMPTS into one report with section headers.
+
+    Args:
+        results: GPT responses, in the order of INSIGHT_SECTIONS
+
+    Returns:
+        Markdown report
+    """
+    return "\n\n".join(
+        f"## {title}\n\n{result.strip()}"
+        for (title, _), result in zip(INSIGHT_SECTIONS, results, strict=True)
+    )
+
 
 class OpenAIAdapter:
     """Adapter for OpenAI API operations."""
@@ -31,7 +106,13 @@ class OpenAIAdapter:
             if not key:
                 raise OpenAIError("OPENAI_API_KEY not configured")
 
-            self.client = OpenAI(api_key=key)
+            from openai import OpenAI
+
+            self._api_key = key
+            self.client = OpenAI(api_key=key, max_retries=MAX_RETRIES)
+            # (summary_key, max_rows) -> summary, least recently used first
+            self._summary_cache: OrderedDict[Tuple[Hashable, int], str] = OrderedDict()
+            self._summary_lock = threading.Lock()
             logger.info("OpenAI client initialized successfully")
 
         except Exception as e:
@@ -49,11 +130,12 @@ class OpenAIAdapter:
             JSON string with structure information
         """
         try:
+            dtypes, null_counts = self._profile_columns(df)
             info = {
                 "shape": df.shape,
                 "columns": list(df.columns),
-                "dtypes": df.dtypes.to_dict(),
-                "null_counts": df.isnull().sum().to_dict(),
+                "dtypes": dtypes,
+                "null_counts": null_counts,
                 "sample_data": df.head(3).to_dict(orient="records"),
             }
             return json.dumps(info, indent=2, default=str)
@@ -62,40 +144,153 @@ class OpenAIAdapter:
             logger.error(f"Error analyzing data structure: {str(e)}")
             raise OpenAIError(f"Failed to analyze data: {str(e)}") from e
 
-    def prepare_data_summary(self, df: pd.DataFrame, max_rows: int = 20) -> str:
+    @staticmethod
+    def _profile_columns(df: pd.DataFrame) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """
+        Collect dtype and null count per column in a single pass.
+
+        Arrow-backed columns report their precomputed null count, so only
+        NumPy-backed columns are scanned.
+
+        Args:
+            df: DataFrame to profile
+
+        Returns:
+            Tuple of (dtype per column, null count per column)
+        """
+        import pandas as pd
+        import pyarrow as pa
+
+        dtypes: Dict[str, Any] = {}
+        null_counts: Dict[str, int] = {}
+        for col, series in df.items():
+            dtypes[col] = series.dtype
+            if isinstance(series.dtype, pd.ArrowDtype):
+                null_counts[col] = pa.array(series.array).null_count
+            else:
+                null_counts[col] = int(series.isna().sum())
+        return dtypes, null_counts
+
+    @staticmethod
+    def _describe_numeric(numeric_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute the statistics of DataFrame.describe() for numeric columns.
+
+        All columns are reduced at once on a single float64 array, instead
+        of pandas' per-column dispatch.
+
+        Args:
+            numeric_df: DataFrame with numeric columns only
+
+        Returns:
+            DataFrame indexed like describe() (count, mean, std, min, quartiles, max)
+        """
+        import numpy as np
+        import pandas as pd
+
+        if numeric_df.empty:
+            # nanpercentile collapses to one row per quantile without data
+            return numeric_df.describe()
+
+        try:
+            values = numeric_df.to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            # e.g. timedelta columns, which describe() handles natively
+            return numeric_df.describe()
+
+        with warnings.catch_warnings():
+            # All-NaN or single-value columns yield NaN, as in describe()
+            warnings.simplefilter("ignore", RuntimeWarning)
+            count = np.count_nonzero(~np.isnan(values), axis=0)
+            mean = np.nanmean(values, axis=0)
+            std = np.nanstd(values, axis=0, ddof=1)
+            quantiles = np.nanpercentile(values, [0, 25, 50, 75, 100], axis=0)
+
+        return pd.DataFrame(
+            np.vstack([count, mean, std, quantiles]),
+            index=DESCRIBE_INDEX,
+            columns=numeric_df.columns,
+        )
+
+    def prepare_data_summary(
+        self,
+        df: pd.DataFrame,
+        max_rows: int = 20,
+        summary_key: Optional[Hashable] = None,
+    ) -> str:
         """
         Prepare a concise data summary for GPT processing.
 
         Args:
             df: DataFrame to summarize
             max_rows: Maximum rows to include in sample
+            summary_key: Optional identifier of the data revision, such as
+                (file_id, modified_time). Summaries are memoized per key, so
+                later questions about an unchanged sheet skip the full scan
+                even though each read returns a new DataFrame.
 
         Returns:
             Formatted data summary string
         """
-        summary = "Dataset Info:\n"
-        summary += f"- Shape: {df.shape[0]} rows, {df.shape[1]} columns\n"
-        summary += f"- Columns: {', '.join(df.columns.astype(str))}\n\n"
+        if summary_key is None:
+            return self._build_data_summary(df, max_rows)
+
+        key = (summary_key, max_rows)
+        with self._summary_lock:
+            cached = self._summary_cache.get(key)
+            if cached is not None:
+                self._summary_cache.move_to_end(key)
+                return cached
+
+        summary = self._build_data_summary(df, max_rows)
+        with self._summary_lock:
+            self._summary_cache[key] = summary
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summary
+
+    def _build_data_summary(self, df: pd.DataFrame, max_rows: int) -> str:
+        """Format the data summary described in prepare_data_summary."""
+        parts = [
+            "Dataset Info:",
+            f"- Shape: {df.shape[0]} rows, {df.shape[1]} columns",
+            f"- Columns: {', '.join(df.columns.astype(str))}",
+            "",
+        ]
 
         # Data types
-        summary += "Data Types:\n"
-        for col, dtype in df.dtypes.items():
-            summary += f"- {col}: {dtype}\n"
+        parts.append("Data Types:")
+        parts.extend(f"- {col}: {dtype}" for col, dtype in df.dtypes.items())
 
         # Sample data
-        summary += f"\nSample Data (first {min(max_rows, len(df))} rows):\n"
-        summary += df.head(max_rows).to_string(index=False, max_cols=10)
+        parts.append("")
+        parts.append(f"Sample Data (first {min(max_rows, len(df))} rows):")
+        parts.append(df.head(max_rows).to_string(index=False, max_cols=10))
 
         # Basic statistics for numeric columns
         numeric_cols = df.select_dtypes(include=["number"]).columns
         if len(numeric_cols) > 0:
-            summary += "\n\nNumeric Statistics:\n"
-            summary += df[numeric_cols].describe().to_string()
-
-        return summary
+            numeric_df = df[numeric_cols]
+            parts.append("")
+            if len(numeric_df) > SUMMARY_SAMPLE_ROWS:
+                # Approximate statistics on very large sheets
+                parts.append(
+                    f"Numeric Statistics (sample of {SUMMARY_SAMPLE_ROWS} of {len(numeric_df)} rows):"
+                )
+                numeric_df = numeric_df.sample(n=SUMMARY_SAMPLE_ROWS, random_state=0)
+            else:
+                parts.append("Numeric Statistics:")
+            parts.append(self._describe_numeric(numeric_df).to_string())
+
+        return "\n".join(parts)
 
     def process_data_with_gpt(
-        self, df: pd.DataFrame, prompt: str, model: str = "gpt-4o-mini"
+        self,
+        df: pd.DataFrame,
+        prompt: str,
+        model: str = "gpt-4o-mini",
+        on_token: Optional[Callable[[str], None]] = None,
+        summary_key: Optional[Hashable] = None,
     ) -> str:
         """
         Process data using GPT with the given prompt.
@@ -104,69 +299,230 @@ class OpenAIAdapter:
             df: DataFrame to analyze
             prompt: User prompt for analysis
             model: GPT model to use
+            on_token: Optional callback; when given, the response is streamed
+                and each text delta is passed to it as it arrives
+            summary_key: Optional data revision key (see prepare_data_summary)
 
         Returns:
-            GPT response string
+            GPT response string (the full text, also when streaming)
 
         Raises:
             OpenAIError: If the API call fails
         """
         try:
-            # Prepare data summary
-            data_summary = self.prepare_data_summary(df)
-
-            # Create the full prompt
-            full_prompt = f"""
-Você é um especialista em análise de dados. Analise os seguintes dados e responda à pergunta do usuário.
-
-DADOS:
-{data_summary}
-
-PERGUNTA DO USUÁRIO:
-{prompt}
-
-Por favor, forneça uma análise detalhada, insights relevantes e recomendações baseadas nos dados apresentados.
-Se necessário, sugira visualizações ou análises adicionais que poderiam ser úteis.
-"""
+            data_summary = self.prepare_data_summary(df, summary_key=summary_key)
+            messages = self._build_messages(data_summary, prompt)
 
             logger.info(f"Sending request to {model}")
 
             # Call OpenAI API
             response = self.client.chat.completions.create(
                 model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Você é um assistente especializado em análise de dados e insights de negócio. Forneça respostas claras, objetivas e acionáveis.",
-                    },
-                    {"role": "user", "content": full_prompt},
-                ],
+                messages=messages,
                 max_tokens=2000,
                 temperature=0.3,
+                stream=on_token is not None,
             )
 
+            if on_token is None:
+                return response.choices[0].message.content
+
+            parts = []
+            for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    on_token(delta)
+                    parts.append(delta)
+            return "".join(parts)
+
+        except Exception as e:
+            logger.error(f"Error processing data with GPT: {str(e)}")
+            raise OpenAIError(f"Failed to process with GPT: {str(e)}") from e
+
+    def _async_client(self) -> AsyncOpenAI:
+        """
+        Create an async client for the running event loop.
+
+        Its connection pool is bound to the loop it first runs on, and
+        process_many starts a new loop per call, so clients are not shared
+        across calls. Use it as an async context manager to close it.
+        """
+        from openai import AsyncOpenAI
+
+        return AsyncOpenAI(api_key=self._api_key, max_retries=MAX_RETRIES)
+
+    async def aprocess_data_with_gpt(
+        self,
+        df: pd.DataFrame,
+        prompt: str,
+        model: str = "gpt-4o-mini",
+        data_summary: Optional[str] = None,
+        client: Optional[AsyncOpenAI] = None,
+    ) -> str:
+        """
+        Process data using GPT without blocking the event loop.
+
+        Args:
+            df: DataFrame to analyze
+            prompt: User prompt for analysis
+            model: GPT model to use
+            data_summary: Optional pre-computed prepare_data_summary(df)
+            client: Optional async client opened on the current loop; a
+                temporary one is created otherwise
+
+        Returns:
+            GPT response string
+
+        Raises:
+            OpenAIError: If the API call fails
+        """
+        try:
+            if data_summary is None:
+                data_summary = self.prepare_data_summary(df)
+            messages = self._build_messages(data_summary, prompt)
+
+            logger.info(f"Sending async request to {model}")
+
+            async with contextlib.AsyncExitStack() as stack:
+                if client is None:
+                    client = await stack.enter_async_context(self._async_client())
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    max_tokens=2000,
+                    temperature=0.3,
+                )
+
             return response.choices[0].message.content
 
         except Exception as e:
             logger.error(f"Error processing data with GPT: {str(e)}")
             raise OpenAIError(f"Failed to process with GPT: {str(e)}") from e
 
+    async def aprocess_many(
+        self,
+        df: pd.DataFrame,
+        prompts: List[str],
+        model: str = "gpt-4o-mini",
+        summary_key: Optional[Hashable] = None,
+    ) -> List[str]:
+        """
+        Send several prompts about the same data concurrently.
+
+        Args:
+            df: DataFrame to analyze
+            prompts: User prompts for analysis
+            model: GPT model to use
+            summary_key: Optional data revision key (see prepare_data_summary)
+
+        Returns:
+            GPT responses, in the same order as the prompts
+
+        Raises:
+            OpenAIError: If any of the API calls fails
+        """
+        # Summarize once and share one connection pool for all prompts
+        data_summary = self.prepare_data_summary(df, summary_key=summary_key)
+        async with self._async_client() as client:
+            return list(
+                await asyncio.gather(
+                    *(
+                        self.aprocess_data_with_gpt(df, prompt, model, data_summary, client)
+                        for prompt in prompts
+                    )
+                )
+            )
+
+    def process_many(
+        self,
+        df: pd.DataFrame,
+        prompts: List[str],
+        model: str = "gpt-4o-mini",
+        summary_key: Optional[Hashable] = None,
+    ) -> List[str]:
+        """
+        Synchronous wrapper around aprocess_many for non-async callers.
+
+        Args:
+            df: DataFrame to analyze
+            prompts: User prompts for analysis
+            model: GPT model to use
+            summary_key: Optional data revision key (see prepare_data_summary)
+
+        Returns:
+            GPT responses, in the same order as the prompts
+        """
+        return asyncio.run(self.aprocess_many(df, prompts, model, summary_key))
+
+    def embed_text(self, text: str, model: str = EMBEDDING_MODEL) -> List[float]:
+        """
+        Compute an embedding vector for the given text.
+
+        Args:
+            text: Text to embed
+            model: Embedding model to use
+
+        Returns:
+            Embedding vector
+
+        Raises:
+            OpenAIError: If the API call fails
+        """
+        return self.embed_texts([text], model)[0]
+
+    def embed_texts(self, texts: List[str], model: str = EMBEDDING_MODEL) -> List[List[float]]:
+        """
+        Compute embedding vectors for several texts in one API call.
+
+        Args:
+            texts: Texts to embed
+            model: Embedding model to use
+
+        Returns:
+            Embedding vectors, in the same order as the texts
+
+        Raises:
+            OpenAIError: If the API call fails
+        """
+        try:
+            response = self.client.embeddings.create(model=model, input=texts)
+            return [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+
+        except Exception as e:
+            logger.error(f"Error computing embeddings: {str(e)}")
+            raise OpenAIError(f"Failed to compute embedding: {str(e)}") from e
+
+    @staticmethod
+    def _build_messages(data_summary: str, prompt: str) -> List[dict]:
+        """
+        Build the chat messages sent to GPT.
+
+        The instructions and the data summary form the system message, so
+        every question about the same data shares an identical prefix that
+        OpenAI's prompt caching can reuse. Only the question itself varies.
+
+        Args:
+            data_summary: Output of prepare_data_summary
+            prompt: User prompt for analysis
+
+        Returns:
+            List of chat messages
+        """
+        return [
+            {"role": "system", "content": SYSTEM_PROMPT_TEMPLATE.format(data_summary=data_summary)},
+            {"role": "user", "content": prompt},
+        ]
+
     def generate_insights(self, df: pd.DataFrame) -> str:
         """
         Generate automatic insights from data.
 
+        Each section of INSIGHT_SECTIONS is requested concurrently.
+
         Args:
             df: DataFrame to analyze
 
         Returns:
-            Generated insights string
-        """
-        prompt = """
-Analise estes dados e forneça:
-1. Principais insights e padrões identificados
-2. Anomalias ou valores interessantes
-3. Correlações importantes (se aplicável)
-4. Recomendações de ações baseadas nos dados
-5. Sugestões de análises adicionais que poderiam ser valiosas
-"""
-        return self.process_data_with_gpt(df, prompt)
+            Generated insights string, one section per header
+        """
+        return format_insights(self.process_many(df, INSIGHT_PROMPTS))
@@ -0,0 +1,225 @@
+"""Semantic cache adapter for reusing answers to similar prompts."""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+ENTRY_FIELDS = ("spreadsheet_id", "modified_time", "prompt", "result")
+
+
+class SemanticCacheAdapter:
+    """
+    File-backed cache that matches prompts by embedding similarity.
+
+    Entries are scoped per spreadsheet revision (file ID and modifiedTime) and
+    looked up with a brute-force inner product over L2-normalized embeddings
+    (cosine similarity). Storing a result for a new revision drops the entries
+    of older ones, so answers about stale data are never returned.
+
+    Entries are persisted to an append-only JSON Lines file, one line per
+    stored result; the file is only rewritten when older revisions are
+    dropped. All access goes through a lock, as one instance is shared by
+    the API worker threads.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, threshold: Optional[float] = None):
+        """
+        Initialize semantic cache adapter.
+
+        Args:
+            cache_dir: Base cache directory (defaults to settings.cache_dir)
+            threshold: Minimum cosine similarity for a hit
+                (defaults to settings.semantic_cache_threshold)
+        """
+        self.cache_dir = Path(cache_dir or settings.cache_dir) / "semantic"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cache_file = self.cache_dir / "index.jsonl"
+        self.threshold = settings.semantic_cache_threshold if threshold is None else threshold
+
+        self._entries: List[Dict[str, Any]] = []
+        self._embeddings = np.empty((0, 0), dtype=np.float32)
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        """Return the embedding as a unit-length float32 vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, spreadsheet_id: str, modified_time: str, embedding: List[float]) -> Optional[str]:
+        """
+        Retrieve the cached result of the most similar prompt.
+
+        Args:
+            spreadsheet_id: Google Sheet ID
+            modified_time: Sheet modifiedTime the result must have been computed on
+            embedding: Embedding of the analysis prompt
+
+        Returns:
+            Cached result or None if no prompt is similar enough
+        """
+        try:
+            with self._lock:
+                indexes = [
+                    i
+                    for i, entry in enumerate(self._entries)
+                    if entry["spreadsheet_id"] == spreadsheet_id
+                    and entry["modified_time"] == modified_time
+                ]
+                if not indexes:
+                    return None
+
+                scores = self._embeddings[indexes] @ self._normalize(embedding)
+                best = int(np.argmax(scores))
+                entry = self._entries[indexes[best]]
+
+            if scores[best] >= self.threshold:
+                logger.info(
+                    f"Semantic cache hit (score {scores[best]:.3f}) for prompt: {entry['prompt']}"
+                )
+                return entry["result"]
+
+            return None
+
+        except Exception as e:
+            logger.warning(f"Error retrieving from semantic cache: {str(e)}")
+            return None
+
+    def set(
+        self,
+        spreadsheet_id: str,
+        modified_time: str,
+        prompt: str,
+        embedding: List[float],
+        result: str,
+    ) -> bool:
+        """
+        Store an analysis result with its prompt embedding.
+
+        Entries of other revisions of the same spreadsheet are dropped.
+
+        Args:
+            spreadsheet_id: Google Sheet ID
+            modified_time: Sheet modifiedTime the result was computed on
+            prompt: Analysis prompt
+            embedding: Embedding of the analysis prompt
+            result: Analysis result to cache
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            entry = {
+                "spreadsheet_id": spreadsheet_id,
+                "modified_time": modified_time,
+                "prompt": prompt,
+                "result": result,
+            }
+            vector = self._normalize(embedding)
+
+            with self._lock:
+                keep = [
+                    i
+                    for i, cached in enumerate(self._entries)
+                    if cached["spreadsheet_id"] != spreadsheet_id
+                    or cached["modified_time"] == modified_time
+                ]
+                dropped = len(self._entries) - len(keep)
+                if dropped:
+                    self._entries = [self._entries[i] for i in keep]
+                    self._embeddings = self._embeddings[keep]
+                    logger.info(f"Dropped {dropped} semantic cache entries of older revisions")
+
+                if self._embeddings.size:
+                    self._embeddings = np.vstack([self._embeddings, vector])
+                else:
+                    self._embeddings = vector.reshape(1, -1)
+                self._entries.append(entry)
+
+                if dropped:
+                    self._save()
+                else:
+                    self._append(entry, vector)
+            return True
+
+        except Exception as e:
+            logger.error(f"Error writing to semantic cache: {str(e)}")
+            return False
+
+    def clear(self) -> int:
+        """
+        Clear all semantic cache entries.
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries = []
+            self._embeddings = np.empty((0, 0), dtype=np.float32)
+
+            try:
+                self.cache_file.unlink(missing_ok=True)
+                logger.info(f"Cleared {count} semantic cache entries")
+            except Exception as e:
+                logger.error(f"Error clearing semantic cache: {str(e)}")
+
+        return count
+
+    def _load(self):
+        """Load persisted entries from disk, skipping unreadable lines."""
+        if not self.cache_file.exists():
+            return
+
+        entries: List[Dict[str, Any]] = []
+        embeddings: List[List[float]] = []
+        skipped = 0
+        try:
+            with open(self.cache_file) as f:
+                for line in f:
+                    try:
+                        data = json.loads(line)
+                        entry = {k: data[k] for k in ENTRY_FIELDS}
+                        embedding = data["embedding"]
+                    except (ValueError, KeyError, TypeError):
+                        # A torn final line from an interrupted write
+                        skipped += 1
+                        continue
+                    entries.append(entry)
+                    embeddings.append(embedding)
+
+            matrix = np.asarray(embeddings, dtype=np.float32) if embeddings else None
+
+            with self._lock:
+                self._entries = entries
+                if matrix is not None:
+                    self._embeddings = matrix
+                if skipped:
+                    # Rewrite so later appends do not land on a torn line
+                    logger.warning(f"Skipped {skipped} unreadable semantic cache lines")
+                    self._save()
+            logger.info(f"Loaded {len(entries)} semantic cache entries")
+
+        except Exception as e:
+            logger.warning(f"Error loading semantic cache: {str(e)}")
+
+    def _append(self, entry: Dict[str, Any], vector: np.ndarray):
+        """Append one entry to the index file. Caller holds the lock."""
+        with open(self.cache_file, "a") as f:
+            f.write(json.dumps({**entry, "embedding": vector.tolist()}) + "\n")
+
+    def _save(self):
+        """Rewrite the index file with the current entries. Caller holds the lock."""
+        with open(self.cache_file, "w") as f:
+            for entry, vector in zip(self._entries, self._embeddings, strict=True):
+                f.write(json.dumps({**entry, "embedding": vector.tolist()}) + "\n")
@@ -40,6 +40,14 @@ def get_batch_service() -> BatchService:
     return BatchService()
 
 
+def close_services() -> None:
+    """Release the Drive connections of the services created so far."""
+    for factory in (get_data_loader_service, get_analyzer_service, get_batch_service):
+        # Calling a factory that was never used would build a service just to close it
+        if factory.cache_info().currsize:
+            factory().close()
+
+
 def store_analysis(analysis: Analysis) -> None:
     """Store analysis in memory for later export retrieval by analysis id."""
     with _analysis_lock:
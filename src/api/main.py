@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 
 from fastapi import FastAPI
 
+from src.api.dependencies import close_services
 from src.api.routes.analysis import router as analysis_router
 from src.api.routes.exports import router as exports_router
 from src.api.routes.spreadsheets import router as spreadsheets_router
 
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    """Close the shared service connections when the server shuts down."""
+    yield
+    close_services()
+
+
 app = FastAPI(
     title="Google Sheets GPT Analyzer API",
     description=("REST API for spreadsheet analysis using Google Drive and OpenAI"),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
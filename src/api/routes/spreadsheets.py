@@ -16,7 +16,7 @@ from src.domain.exceptions import (
     OpenAIError,
     ValidationError,
 )
-from src.domain.models import Analysis
+from src.domain.models import Analysis, FileInfo
 from src.services.analyzer import AnalyzerService
 from src.services.data_loader import DataLoaderService
 
@@ -36,10 +36,9 @@ class InsightsRequest(BaseModel):
     use_cache: bool = True
 
 
-def _resolve_file_name(data_loader: DataLoaderService, sheet_id: str) -> str:
-    """Resolve a spreadsheet name from Google Drive by id."""
-    file_info = data_loader.drive_adapter.get_file_info(sheet_id)
-    return file_info.name
+def _resolve_file_info(data_loader: DataLoaderService, sheet_id: str) -> FileInfo:
+    """Resolve spreadsheet metadata (name, modifiedTime) from Google Drive by id."""
+    return data_loader.drive_adapter.get_file_info(sheet_id)
 
 
 @router.get("")
@@ -75,12 +74,13 @@ def analyze_spreadsheet(
 ):
     """Analyze spreadsheet with a custom prompt."""
     try:
-        file_name = _resolve_file_name(data_loader, sheet_id)
+        file_info = _resolve_file_info(data_loader, sheet_id)
         analysis = analyzer.analyze_spreadsheet(
             sheet_id,
-            file_name,
+            file_info.name,
             payload.prompt,
             use_cache=payload.use_cache,
+            modified_time=file_info.modified_time,
         )
         store_analysis(analysis)
         return analysis
@@ -115,11 +115,12 @@ def generate_insights(
 ):
     """Generate automatic insights for a spreadsheet."""
     try:
-        file_name = _resolve_file_name(data_loader, sheet_id)
+        file_info = _resolve_file_info(data_loader, sheet_id)
         analysis = analyzer.generate_insights(
             sheet_id,
-            file_name,
+            file_info.name,
             use_cache=payload.use_cache,
+            modified_time=file_info.modified_time,
         )
         store_analysis(analysis)
         return analysis
@@ -2,9 +2,12 @@
 
 import logging
 import sys
+from functools import cached_property
+from typing import Callable
 
 from src.config import settings
 from src.domain.exceptions import ApplicationError
+from src.domain.models import Analysis
 from src.services.analyzer import AnalyzerService
 from src.services.batch import BatchService
 from src.services.data_loader import DataLoaderService
@@ -23,21 +26,51 @@ class CLIApplication:
     """Main CLI application."""
 
     def __init__(self):
-        """Initialize CLI application with services."""
-        try:
-            self.data_loader = DataLoaderService()
-            self.analyzer = AnalyzerService()
-            self.export_service = ExportService()
-            self.batch_service = BatchService()
-            self.scheduler = SchedulerService()
-
-            self.current_dataset = None
-            self.current_file_name = ""
-            self.current_file_id = ""
-
-        except ApplicationError as e:
-            logger.error(f"Failed to initialize application: {e}")
-            sys.exit(1)
+        """Initialize CLI application state.
+
+        Services are created on first use, so the menu renders before the
+        Google and OpenAI clients are set up.
+        """
+        self.current_dataset = None
+        self.current_file_name = ""
+        self.current_file_id = ""
+        self.current_modified_time = None
+
+    @cached_property
+    def data_loader(self) -> DataLoaderService:
+        """Data loader service."""
+        return DataLoaderService()
+
+    @cached_property
+    def analyzer(self) -> AnalyzerService:
+        """Analyzer service."""
+        return AnalyzerService()
+
+    @cached_property
+    def export_service(self) -> ExportService:
+        """Export service."""
+        return ExportService()
+
+    @cached_property
+    def batch_service(self) -> BatchService:
+        """Batch processing service."""
+        return BatchService()
+
+    @cached_property
+    def scheduler(self) -> SchedulerService:
+        """Scheduler service."""
+        return SchedulerService()
+
+    def close(self):
+        """Release the connections of the services created during the session."""
+        for name in ("data_loader", "analyzer", "batch_service", "scheduler"):
+            # cached_property stores created services in the instance dict
+            service = self.__dict__.get(name)
+            if service is not None:
+                try:
+                    service.close()
+                except Exception as e:
+                    logger.warning(f"Error closing {name}: {e}")
 
     def display_menu(self):
         """Display the main menu."""
@@ -55,6 +88,65 @@ class CLIApplication:
         print("9. 🚪 Sair")
         print("=" * 70)
 
+    @staticmethod
+    def _stream_analysis(title: str, run: Callable[[Callable[[str], None]], Analysis]) -> Analysis:
+        """
+        Print an analysis result block, streaming GPT output as it arrives.
+
+        Args:
+            title: Header line of the result block
+            run: Function performing the analysis; it receives the token callback
+
+        Returns:
+            The completed Analysis
+        """
+        print("\n" + "=" * 70)
+        print(title)
+        print("=" * 70)
+
+        analysis = run(lambda token: print(token, end="", flush=True))
+
+        if analysis.cached:
+            # Nothing was streamed for a cached result
+            print("💾 [RESULTADO EM CACHE]")
+            print(analysis.result)
+        else:
+            print()
+        print("=" * 70)
+        return analysis
+
+    @staticmethod
+    def _print_analysis(title: str, analysis: Analysis):
+        """
+        Print a completed analysis result block.
+
+        Args:
+            title: Header line of the result block
+            analysis: Analysis to print
+        """
+        print("\n" + "=" * 70)
+        print(title)
+        print("=" * 70)
+        if analysis.cached:
+            print("💾 [RESULTADO EM CACHE]")
+        print(analysis.result)
+        print("=" * 70)
+
+    def _refresh_modified_time(self):
+        """
+        Re-read the current sheet's modifiedTime from Drive.
+
+        Options 4 and 5 reuse the sheet picked earlier in the session, so the
+        revision captured then may be stale. If the lookup fails the revision
+        is left unknown, which makes the next read export the sheet again.
+        """
+        try:
+            file_info = self.data_loader.drive_adapter.get_file_info(self.current_file_id)
+            self.current_modified_time = file_info.modified_time
+        except ApplicationError as e:
+            logger.warning(f"Could not refresh sheet revision: {e}")
+            self.current_modified_time = None
+
     def list_spreadsheets(self):
         """List available spreadsheets."""
         print("\n🔍 Buscando planilhas...")
@@ -102,25 +194,31 @@ class CLIApplication:
 
                     if not prompt:
                         print("\n💡 Gerando insights automáticos...")
-                        analysis = self.analyzer.generate_insights(selected.id, selected.name)
+                        self._print_analysis(
+                            f"📊 Análise: {selected.name}",
+                            self.analyzer.generate_insights(
+                                selected.id,
+                                selected.name,
+                                modified_time=selected.modified_time,
+                            ),
+                        )
                     else:
                         print("\n🔍 Analisando com sua pergunta...")
-                        analysis = self.analyzer.analyze_spreadsheet(
-                            selected.id, selected.name, prompt
+                        self._stream_analysis(
+                            f"📊 Análise: {selected.name}",
+                            lambda on_token: self.analyzer.analyze_spreadsheet(
+                                selected.id,
+                                selected.name,
+                                prompt,
+                                modified_time=selected.modified_time,
+                                on_token=on_token,
+                            ),
                         )
 
                     # Store for later export
                     self.current_file_id = selected.id
                     self.current_file_name = selected.name
-
-                    # Display result
-                    print("\n" + "=" * 70)
-                    print(f"📊 Análise: {selected.name}")
-                    print("=" * 70)
-                    if analysis.cached:
-                        print("💾 [RESULTADO EM CACHE]")
-                    print(analysis.result)
-                    print("=" * 70)
+                    self.current_modified_time = selected.modified_time
 
                 else:
                     print("❌ Seleção inválida!")
@@ -151,16 +249,18 @@ class CLIApplication:
                     selected = spreadsheets[sheet_choice]
                     print(f"\n💡 Gerando insights para: {selected.name}...")
 
-                    analysis = self.analyzer.generate_insights(selected.id, selected.name)
+                    self._print_analysis(
+                        f"📊 Insights: {selected.name}",
+                        self.analyzer.generate_insights(
+                            selected.id,
+                            selected.name,
+                            modified_time=selected.modified_time,
+                        ),
+                    )
 
                     self.current_file_id = selected.id
                     self.current_file_name = selected.name
-
-                    print("\n" + "=" * 70)
-                    print(f"📊 Insights: {selected.name}")
-                    print("=" * 70)
-                    print(analysis.result)
-                    print("=" * 70)
+                    self.current_modified_time = selected.modified_time
 
                 else:
                     print("❌ Seleção inválida!")
@@ -178,24 +278,40 @@ class CLIApplication:
             return
 
         try:
+            self._refresh_modified_time()
             print(f"\nPlanilha atual: {self.current_file_name}")
-            prompt = input("Digite sua pergunta: ").strip()
+            print("(separe várias perguntas com ';' para processá-las em paralelo)")
+            prompts = [p.strip() for p in input("Digite sua pergunta: ").split(";") if p.strip()]
 
-            if not prompt:
+            if not prompts:
                 print("❌ Pergunta vazia!")
                 return
 
-            print("\n🔍 Processando sua pergunta...")
+            if len(prompts) == 1:
+                print("\n🔍 Processando sua pergunta...")
+                self._stream_analysis(
+                    "🔍 Resposta",
+                    lambda on_token: self.analyzer.analyze_spreadsheet(
+                        self.current_file_id,
+                        self.current_file_name,
+                        prompts[0],
+                        modified_time=self.current_modified_time,
+                        on_token=on_token,
+                    ),
+                )
+                return
 
-            analysis = self.analyzer.analyze_spreadsheet(
-                self.current_file_id, self.current_file_name, prompt
+            # Concurrent answers cannot be streamed interleaved; print them whole
+            print(f"\n🔍 Processando {len(prompts)} perguntas em paralelo...")
+            analyses = self.analyzer.analyze_many(
+                self.current_file_id,
+                self.current_file_name,
+                prompts,
+                modified_time=self.current_modified_time,
             )
 
-            print("\n" + "=" * 70)
-            print("🔍 Resposta")
-            print("=" * 70)
-            print(analysis.result)
-            print("=" * 70)
+            for analysis in analyses:
+                self._print_analysis(f"🔍 Resposta: {analysis.prompt}", analysis)
 
         except ApplicationError as e:
             print(f"❌ Erro ao processar pergunta: {e}")
@@ -224,8 +340,11 @@ class CLIApplication:
 
                 # Generate a simple analysis if needed
                 print(f"\n💾 Exportando em {format_choice.upper()}...")
+                self._refresh_modified_time()
                 analysis = self.analyzer.generate_insights(
-                    self.current_file_id, self.current_file_name
+                    self.current_file_id,
+                    self.current_file_name,
+                    modified_time=self.current_modified_time,
                 )
 
                 export_result = self.export_service.export_analysis(analysis, format_choice)
@@ -385,12 +504,14 @@ Analise estes dados e forneça:
 
 def main():
     """Entry point for the CLI application."""
+    app = CLIApplication()
     try:
-        app = CLIApplication()
         app.run()
     except Exception as e:
         logger.error(f"Fatal error: {e}")
         sys.exit(1)
+    finally:
+        app.close()
 
 
 if __name__ == "__main__":
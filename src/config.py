@@ -3,7 +3,7 @@
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic_settings import BaseSettings
 
@@ -25,6 +25,12 @@ class Settings(BaseSettings):
     cache_dir: str = ".cache"
     output_dir: str = "output"
     max_spreadsheet_size_mb: int = 100
+    # csv is faster but holds formatted display values; xlsx keeps typed cells
+    sheets_export_format: Literal["csv", "xlsx"] = "csv"
+
+    # Semantic Cache Configuration
+    semantic_cache_enabled: bool = False
+    semantic_cache_threshold: float = 0.95
 
     class Config:
         env_file = ".env"
@@ -89,5 +95,8 @@ except ConfigError:
         cache_dir=".cache",
         output_dir="output",
         max_spreadsheet_size_mb=100,
+        sheets_export_format="csv",
+        semantic_cache_enabled=False,
+        semantic_cache_threshold=0.95,
     )
     settings.ensure_directories()
@@ -1,17 +1,35 @@
 """Data analysis service."""
 
+from __future__ import annotations
+
 import logging
 import uuid
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 from src.adapters.cache import CacheAdapter
 from src.adapters.google_drive import GoogleDriveAdapter
-from src.adapters.openai_client import OpenAIAdapter
+from src.adapters.openai_client import INSIGHT_PROMPTS, OpenAIAdapter, format_insights
+from src.config import settings
 from src.domain.exceptions import OpenAIError
 from src.domain.models import Analysis
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from src.adapters.semantic_cache import SemanticCacheAdapter
+
 logger = logging.getLogger(__name__)
 
+# Recorded as the prompt of the combined insights Analysis
+INSIGHTS_PROMPT = """
+Analise estes dados e forneça:
+1. Principais insights e padrões identificados
+2. Anomalias ou valores interessantes
+3. Correlações importantes (se aplicável)
+4. Recomendações de ações baseadas nos dados
+5. Sugestões de análises adicionais que poderiam ser valiosas
+"""
+
 
 class AnalyzerService:
     """Service for analyzing data using GPT."""
@@ -21,6 +39,7 @@ class AnalyzerService:
         openai_adapter: Optional[OpenAIAdapter] = None,
         cache_adapter: Optional[CacheAdapter] = None,
         drive_adapter: Optional[GoogleDriveAdapter] = None,
+        semantic_cache: Optional[SemanticCacheAdapter] = None,
     ):
         """
         Initialize analyzer service.
@@ -29,13 +48,28 @@ class AnalyzerService:
             openai_adapter: OpenAI adapter (defaults to new instance)
             cache_adapter: Cache adapter (defaults to new instance)
             drive_adapter: Google Drive adapter (for data loading)
+            semantic_cache: Semantic cache adapter (defaults to a new instance
+                when SEMANTIC_CACHE_ENABLED is set, otherwise disabled)
         """
         self.openai_adapter = openai_adapter or OpenAIAdapter()
         self.cache_adapter = cache_adapter or CacheAdapter()
         self.drive_adapter = drive_adapter or GoogleDriveAdapter()
+        self.semantic_cache = semantic_cache
+        if self.semantic_cache is None and settings.semantic_cache_enabled:
+            # Imported here so NumPy is only loaded when the feature is on
+            from src.adapters.semantic_cache import SemanticCacheAdapter
+
+            self.semantic_cache = SemanticCacheAdapter()
 
     def analyze_spreadsheet(
-        self, file_id: str, file_name: str, prompt: str, use_cache: bool = True
+        self,
+        file_id: str,
+        file_name: str,
+        prompt: str,
+        use_cache: bool = True,
+        modified_time: Optional[str] = None,
+        on_token: Optional[Callable[[str], None]] = None,
+        df: Optional[pd.DataFrame] = None,
     ) -> Analysis:
         """
         Analyze a spreadsheet with a custom prompt.
@@ -45,6 +79,10 @@ class AnalyzerService:
             file_name: File name for reference
             prompt: Analysis prompt
             use_cache: Whether to check cache first
+            modified_time: Optional file modifiedTime, lets Drive reads hit the sheet cache
+            on_token: Optional callback receiving GPT output as it streams. It is
+                not called for cached results.
+            df: Optional already downloaded sheet; skips the Drive read
 
         Returns:
             Analysis object
@@ -56,9 +94,10 @@ class AnalyzerService:
             logger.info(f"Analyzing spreadsheet: {file_name}")
 
             # Check cache
-            cached_result = None
+            embeddings: Dict[int, List[float]] = {}
             if use_cache:
-                cached_result = self.cache_adapter.get(file_id, prompt)
+                cached, embeddings = self._lookup_cache(file_id, [prompt], modified_time)
+                cached_result = cached.get(0)
                 if cached_result:
                     logger.info("Using cached analysis result")
                     return Analysis(
@@ -71,13 +110,16 @@ class AnalyzerService:
                     )
 
             # Load data
-            df = self.drive_adapter.read_spreadsheet(file_id)
+            if df is None:
+                df = self.drive_adapter.read_spreadsheet(file_id, modified_time=modified_time)
 
             # Analyze with GPT
-            result = self.openai_adapter.process_data_with_gpt(df, prompt)
+            result = self.openai_adapter.process_data_with_gpt(
+                df, prompt, on_token=on_token, summary_key=self._summary_key(file_id, modified_time)
+            )
 
             # Cache result
-            self.cache_adapter.set(file_id, prompt, result)
+            self._store_cache(file_id, [prompt], [result], modified_time, embeddings)
 
             # Create Analysis object
             analysis = Analysis(
@@ -96,35 +138,232 @@ class AnalyzerService:
             logger.error(f"Error analyzing spreadsheet: {str(e)}")
             raise OpenAIError(f"Failed to analyze spreadsheet: {str(e)}") from e
 
-    def generate_insights(self, file_id: str, file_name: str, use_cache: bool = True) -> Analysis:
+    def analyze_many(
+        self,
+        file_id: str,
+        file_name: str,
+        prompts: List[str],
+        use_cache: bool = True,
+        modified_time: Optional[str] = None,
+    ) -> List[Analysis]:
+        """
+        Analyze a spreadsheet with several prompts, sending uncached ones concurrently.
+
+        Args:
+            file_id: Google Sheet file ID
+            file_name: File name for reference
+            prompts: Analysis prompts
+            use_cache: Whether to check cache first
+            modified_time: Optional file modifiedTime, lets Drive reads hit the sheet cache
+
+        Returns:
+            Analysis objects, in the same order as the prompts
+
+        Raises:
+            OpenAIError: If analysis fails
+        """
+        try:
+            logger.info(f"Analyzing spreadsheet: {file_name} ({len(prompts)} prompts)")
+
+            results: Dict[int, str] = {}
+            embeddings: Dict[int, List[float]] = {}
+            if use_cache:
+                results, embeddings = self._lookup_cache(file_id, prompts, modified_time)
+
+            cached_indexes = set(results)
+            pending = [i for i in range(len(prompts)) if i not in cached_indexes]
+
+            if pending:
+                # Load data once and fan out the remaining prompts
+                df = self.drive_adapter.read_spreadsheet(file_id, modified_time=modified_time)
+                responses = self.openai_adapter.process_many(
+                    df,
+                    [prompts[i] for i in pending],
+                    summary_key=self._summary_key(file_id, modified_time),
+                )
+
+                self._store_cache(
+                    file_id,
+                    [prompts[i] for i in pending],
+                    responses,
+                    modified_time,
+                    {n: embeddings[i] for n, i in enumerate(pending) if i in embeddings},
+                )
+                results.update(zip(pending, responses, strict=True))
+
+            analyses = [
+                Analysis(
+                    id=str(uuid.uuid4()),
+                    dataset_id=file_id,
+                    dataset_name=file_name,
+                    prompt=prompt,
+                    result=results[i],
+                    cached=i in cached_indexes,
+                )
+                for i, prompt in enumerate(prompts)
+            ]
+
+            logger.info(f"Analysis completed: {len(pending)} sent, {len(cached_indexes)} cached")
+            return analyses
+
+        except Exception as e:
+            logger.error(f"Error analyzing spreadsheet: {str(e)}")
+            raise OpenAIError(f"Failed to analyze spreadsheet: {str(e)}") from e
+
+    def generate_insights(
+        self,
+        file_id: str,
+        file_name: str,
+        use_cache: bool = True,
+        modified_time: Optional[str] = None,
+    ) -> Analysis:
         """
         Generate automatic insights from a spreadsheet.
 
+        The report sections (insights, anomalies, correlations, recommendations,
+        further analyses) are separate prompts sent concurrently through
+        analyze_many, and each section is cached on its own.
+
         Args:
             file_id: Google Sheet file ID
             file_name: File name for reference
             use_cache: Whether to check cache first
+            modified_time: Optional file modifiedTime, lets Drive reads hit the sheet cache
 
         Returns:
             Analysis object with insights
+
+        Raises:
+            OpenAIError: If analysis fails
         """
-        prompt = """
-Analise estes dados e forneça:
-1. Principais insights e padrões identificados
-2. Anomalias ou valores interessantes
-3. Correlações importantes (se aplicável)
-4. Recomendações de ações baseadas nos dados
-5. Sugestões de análises adicionais que poderiam ser valiosas
-"""
-        return self.analyze_spreadsheet(file_id, file_name, prompt, use_cache)
+        sections = self.analyze_many(file_id, file_name, INSIGHT_PROMPTS, use_cache, modified_time)
+
+        return Analysis(
+            id=str(uuid.uuid4()),
+            dataset_id=file_id,
+            dataset_name=file_name,
+            prompt=INSIGHTS_PROMPT,
+            result=format_insights([section.result for section in sections]),
+            cached=all(section.cached for section in sections),
+        )
+
+    def is_cached(self, file_id: str, prompt: str) -> bool:
+        """
+        Check whether a prompt has an exact cached result for a spreadsheet.
+
+        Args:
+            file_id: Google Sheet file ID
+            prompt: Analysis prompt
+
+        Returns:
+            True if analyze_spreadsheet would answer from the exact cache
+        """
+        return bool(self.cache_adapter.get(file_id, prompt))
+
+    @staticmethod
+    def _summary_key(file_id: str, modified_time: Optional[str]) -> Optional[Tuple[str, str]]:
+        """Identify a sheet revision for the data summary memo, if the revision is known."""
+        return (file_id, modified_time) if modified_time else None
+
+    def _lookup_cache(
+        self, file_id: str, prompts: List[str], modified_time: Optional[str] = None
+    ) -> Tuple[Dict[int, str], Dict[int, List[float]]]:
+        """
+        Look up prompts in the exact cache, then misses in the semantic cache.
+
+        The semantic cache is only consulted when the sheet revision is known.
+        All exact-cache misses are embedded in a single API call.
+
+        Args:
+            file_id: Google Sheet file ID
+            prompts: Analysis prompts
+            modified_time: Optional file modifiedTime scoping semantic cache entries
+
+        Returns:
+            Tuple of (cached results, prompt embeddings), both keyed by prompt
+            index. Embeddings are returned so a later _store_cache does not
+            recompute them.
+        """
+        results: Dict[int, str] = {}
+        for i, prompt in enumerate(prompts):
+            cached_result = self.cache_adapter.get(file_id, prompt)
+            if cached_result:
+                results[i] = cached_result
+
+        misses = [i for i in range(len(prompts)) if i not in results]
+        if not misses or not self.semantic_cache or not modified_time:
+            return results, {}
+
+        vectors = self._embed_prompts([prompts[i] for i in misses])
+        if vectors is None:
+            return results, {}
+
+        embeddings = dict(zip(misses, vectors, strict=True))
+        for i, embedding in embeddings.items():
+            cached_result = self.semantic_cache.get(file_id, modified_time, embedding)
+            if cached_result:
+                results[i] = cached_result
+
+        return results, embeddings
+
+    def _store_cache(
+        self,
+        file_id: str,
+        prompts: List[str],
+        results: List[str],
+        modified_time: Optional[str] = None,
+        embeddings: Optional[Dict[int, List[float]]] = None,
+    ):
+        """
+        Store fresh results in the exact cache and, if enabled, the semantic cache.
+
+        Prompts without an embedding from _lookup_cache are embedded in a
+        single API call.
+
+        Args:
+            file_id: Google Sheet file ID
+            prompts: Analysis prompts
+            results: Analysis results, in the same order as the prompts
+            modified_time: Optional file modifiedTime; without it the semantic cache is skipped
+            embeddings: Prompt embeddings from _lookup_cache, keyed by prompt index
+        """
+        for prompt, result in zip(prompts, results, strict=True):
+            self.cache_adapter.set(file_id, prompt, result)
+
+        if not self.semantic_cache or not modified_time:
+            return
+
+        embeddings = dict(embeddings or {})
+        missing = [i for i in range(len(prompts)) if i not in embeddings]
+        if missing:
+            vectors = self._embed_prompts([prompts[i] for i in missing])
+            if vectors is not None:
+                embeddings.update(zip(missing, vectors, strict=True))
+
+        for i, embedding in embeddings.items():
+            self.semantic_cache.set(file_id, modified_time, prompts[i], embedding, results[i])
+
+    def _embed_prompts(self, prompts: List[str]) -> Optional[List[List[float]]]:
+        """Embed prompts for the semantic cache; failures only disable the lookup."""
+        try:
+            return self.openai_adapter.embed_texts(prompts)
+        except OpenAIError as e:
+            logger.warning(f"Semantic cache unavailable: {str(e)}")
+            return None
 
     def clear_cache(self) -> int:
         """
-        Clear the analysis cache.
+        Clear the analysis cache and the downloaded sheet cache.
 
         Returns:
             Number of cache entries deleted
         """
-        count = self.cache_adapter.clear()
+        count = self.cache_adapter.clear() + self.drive_adapter.clear_sheet_cache()
+        if self.semantic_cache:
+            count += self.semantic_cache.clear()
         logger.info(f"Cache cleared: {count} entries deleted")
         return count
+
+    def close(self):
+        """Release the Drive connection."""
+        self.drive_adapter.close()
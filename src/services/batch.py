@@ -1,7 +1,10 @@
 """Batch processing service."""
 
+from __future__ import annotations
+
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from tqdm import tqdm
 
@@ -10,8 +13,15 @@ from src.domain.exceptions import ApplicationError
 from src.services.analyzer import AnalyzerService
 from src.services.export import ExportService
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Sheets downloaded concurrently ahead of their analysis. Larger windows keep
+# more downloads in flight but hold more DataFrames in memory at once.
+PREFETCH_WINDOW = 32
+
 
 class BatchService:
     """Service for batch processing multiple spreadsheets."""
@@ -34,6 +44,11 @@ class BatchService:
         self.export_service = export_service or ExportService()
         self.drive_adapter = drive_adapter or GoogleDriveAdapter()
 
+    def close(self):
+        """Release the Drive connections of this service and its analyzer."""
+        self.drive_adapter.close()
+        self.analyzer_service.close()
+
     def process_folder(
         self,
         folder_id: str,
@@ -69,15 +84,26 @@ class BatchService:
             logger.info(f"Found {len(spreadsheets)} spreadsheets to process")
 
             results = []
+            frames: Dict[str, pd.DataFrame] = {}
 
             # Process each spreadsheet with progress bar
-            for sheet in tqdm(spreadsheets, desc="Processing spreadsheets", unit="sheet"):
+            for i, sheet in enumerate(
+                tqdm(spreadsheets, desc="Processing spreadsheets", unit="sheet")
+            ):
+                if i % PREFETCH_WINDOW == 0:
+                    window = spreadsheets[i : i + PREFETCH_WINDOW]
+                    frames = self._prefetch([(s.id, s.modified_time) for s in window], prompt)
+
                 try:
                     logger.info(f"Processing: {sheet.name}")
 
                     # Analyze
                     analysis = self.analyzer_service.analyze_spreadsheet(
-                        sheet.id, sheet.name, prompt
+                        sheet.id,
+                        sheet.name,
+                        prompt,
+                        modified_time=sheet.modified_time,
+                        df=frames.pop(sheet.id, None),
                     )
 
                     result = {
@@ -143,14 +169,24 @@ class BatchService:
             raise ApplicationError("file_ids and file_names must have the same length")
 
         results = []
-
-        for file_id, file_name in tqdm(
-            zip(file_ids, file_names, strict=False),
-            desc="Processing",
-            unit="file",
+        frames: Dict[str, pd.DataFrame] = {}
+
+        for i, (file_id, file_name) in enumerate(
+            tqdm(
+                zip(file_ids, file_names, strict=False),
+                desc="Processing",
+                unit="file",
+                total=len(file_ids),
+            )
         ):
+            if i % PREFETCH_WINDOW == 0:
+                window = file_ids[i : i + PREFETCH_WINDOW]
+                frames = self._prefetch([(f, None) for f in window], prompt)
+
             try:
-                analysis = self.analyzer_service.analyze_spreadsheet(file_id, file_name, prompt)
+                analysis = self.analyzer_service.analyze_spreadsheet(
+                    file_id, file_name, prompt, df=frames.pop(file_id, None)
+                )
 
                 result = {
                     "file_id": file_id,
@@ -179,3 +215,42 @@ class BatchService:
                 )
 
         return results
+
+    def _prefetch(
+        self, files: List[Tuple[str, Optional[str]]], prompt: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download the sheets that will need a GPT call, concurrently.
+
+        Sheets whose analysis is already cached are skipped. A sheet that fails
+        to download is left out, so analyze_spreadsheet reads it again and
+        reports the error for that sheet only.
+
+        Args:
+            files: (file ID, modifiedTime) pairs
+            prompt: Analysis prompt, used to skip cached analyses
+
+        Returns:
+            Downloaded DataFrames by file ID
+        """
+        pending = [(f, m) for f, m in files if not self.analyzer_service.is_cached(f, prompt)]
+        if not pending:
+            return {}
+
+        try:
+            frames = asyncio.run(
+                self.drive_adapter.aread_many(
+                    [f for f, _ in pending],
+                    modified_times=[m for _, m in pending],
+                    return_exceptions=True,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Concurrent download failed, reading sheets one by one: {str(e)}")
+            return {}
+
+        return {
+            file_id: df
+            for (file_id, _), df in zip(pending, frames, strict=True)
+            if not isinstance(df, BaseException)
+        }
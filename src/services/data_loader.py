@@ -1,14 +1,18 @@
 """Data loading service."""
 
-import logging
-from typing import List, Optional
+from __future__ import annotations
 
-import pandas as pd
+import asyncio
+import logging
+from typing import TYPE_CHECKING, List, Optional
 
 from src.adapters.google_drive import GoogleDriveAdapter
 from src.domain.exceptions import ValidationError
 from src.domain.models import Dataset, FileInfo
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +28,10 @@ class DataLoaderService:
         """
         self.drive_adapter = drive_adapter or GoogleDriveAdapter()
 
+    def close(self):
+        """Release the Drive connection."""
+        self.drive_adapter.close()
+
     def list_spreadsheets(self, folder_id: Optional[str] = None) -> List[FileInfo]:
         """
         List available spreadsheets.
@@ -38,7 +46,11 @@ class DataLoaderService:
         return self.drive_adapter.list_spreadsheets(folder_id)
 
     def load_spreadsheet(
-        self, file_id: str, file_name: str, sheet_name: Optional[str] = None
+        self,
+        file_id: str,
+        file_name: str,
+        sheet_name: Optional[str] = None,
+        modified_time: Optional[str] = None,
     ) -> Dataset:
         """
         Load a spreadsheet and return as Dataset object.
@@ -47,6 +59,7 @@ class DataLoaderService:
             file_id: Google Sheet file ID
             file_name: File name for reference
             sheet_name: Optional specific sheet name
+            modified_time: Optional file modifiedTime, lets Drive reads hit the sheet cache
 
         Returns:
             Dataset object
@@ -58,7 +71,7 @@ class DataLoaderService:
             logger.info(f"Loading spreadsheet: {file_name} (ID: {file_id})")
 
             # Load data
-            df = self.drive_adapter.read_spreadsheet(file_id, sheet_name)
+            df = self.drive_adapter.read_spreadsheet(file_id, sheet_name, modified_time)
 
             # Validate
             self._validate_dataframe(df)
@@ -80,6 +93,45 @@ class DataLoaderService:
             logger.error(f"Error loading spreadsheet: {str(e)}")
             raise ValidationError(f"Failed to load spreadsheet: {str(e)}") from e
 
+    def load_spreadsheets(self, files: List[FileInfo]) -> List[Dataset]:
+        """
+        Load several spreadsheets, downloading them concurrently.
+
+        Args:
+            files: Spreadsheets to load (e.g. from list_spreadsheets)
+
+        Returns:
+            Dataset objects, in the same order as the files
+
+        Raises:
+            ValidationError: If data validation fails
+        """
+        try:
+            logger.info(f"Loading {len(files)} spreadsheets concurrently")
+
+            frames = asyncio.run(
+                self.drive_adapter.aread_many(
+                    [file.id for file in files],
+                    modified_times=[file.modified_time for file in files],
+                )
+            )
+
+            datasets = []
+            for file, df in zip(files, frames, strict=True):
+                self._validate_dataframe(df)
+                datasets.append(
+                    Dataset(id=file.id, name=file.name, shape=df.shape, columns=list(df.columns))
+                )
+
+            logger.info(f"Successfully loaded {len(datasets)} datasets")
+            return datasets
+
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.error(f"Error loading spreadsheets: {str(e)}")
+            raise ValidationError(f"Failed to load spreadsheets: {str(e)}") from e
+
     @staticmethod
     def _validate_dataframe(df: pd.DataFrame):
         """
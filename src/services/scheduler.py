@@ -111,6 +111,11 @@ class SchedulerService:
             self.scheduler.shutdown()
             logger.info("Scheduler stopped")
 
+    def close(self):
+        """Stop the scheduler and release the batch service's Drive connections."""
+        self.stop()
+        self.batch_service.close()
+
     def list_jobs(self) -> List[Dict[str, Any]]:
         """
         List all scheduled jobs.
@@ -1,12 +1,17 @@
 """Pytest configuration and shared fixtures."""
 
+import json
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 
+from src.adapters import openai_client
+
 
 @pytest.fixture
 def sample_dataframe():
@@ -60,3 +65,49 @@ def mock_settings():
         mock.log_level = "INFO"
         mock.get_credentials_dict.return_value = {"type": "service_account"}
         yield mock
+
+
+class _ChatCompletionHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive chat completions endpoint."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "gpt-4o-mini",
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": "ok"},
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def openai_server(monkeypatch):
+    """Serve chat completions over real HTTP and point the SDK at it."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatCompletionHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    # Surface connection errors instead of letting the SDK retry them away
+    monkeypatch.setattr(openai_client, "MAX_RETRIES", 0)
+    yield
+    server.shutdown()
+    server.server_close()
@@ -1,9 +1,11 @@
 """Tests for analyzer service."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.adapters.openai_client import INSIGHT_PROMPTS, OpenAIAdapter
 from src.domain.exceptions import OpenAIError
 from src.services.analyzer import AnalyzerService
 
@@ -41,8 +43,10 @@ def test_analyze_spreadsheet_cache_miss_calls_openai_and_stores_result(sample_da
 
     assert analysis.cached is False
     assert analysis.result == "fresh answer"
-    drive.read_spreadsheet.assert_called_once_with("sheet-1")
-    openai.process_data_with_gpt.assert_called_once_with(sample_dataframe, "Explain trends")
+    drive.read_spreadsheet.assert_called_once_with("sheet-1", modified_time=None)
+    openai.process_data_with_gpt.assert_called_once_with(
+        sample_dataframe, "Explain trends", on_token=None, summary_key=None
+    )
     cache.set.assert_called_once_with("sheet-1", "Explain trends", "fresh answer")
 
 
@@ -83,36 +87,327 @@ def test_analyze_spreadsheet_wraps_errors_as_openai_error(sample_dataframe):
         service.analyze_spreadsheet("sheet-1", "Sales", "Explain trends")
 
 
-def test_generate_insights_delegates_to_analyze_spreadsheet():
-    """Should delegate to analyze_spreadsheet with built-in prompt."""
+def test_generate_insights_sends_sections_concurrently(sample_dataframe):
+    """Should request each insight section through process_many and join them."""
+    openai_adapter = MagicMock()
+    openai_adapter.process_many.return_value = [f"answer {i}" for i in range(5)]
+    cache = MagicMock()
+    cache.get.return_value = None
+    drive = MagicMock()
+    drive.read_spreadsheet.return_value = sample_dataframe
     service = AnalyzerService(
-        openai_adapter=MagicMock(),
-        cache_adapter=MagicMock(),
-        drive_adapter=MagicMock(),
+        openai_adapter=openai_adapter, cache_adapter=cache, drive_adapter=drive
     )
 
-    with patch.object(service, "analyze_spreadsheet") as analyze_mock:
-        analyze_mock.return_value = MagicMock(result="ok")
+    analysis = service.generate_insights("sheet-1", "Sales")
+
+    openai_adapter.process_many.assert_called_once_with(
+        sample_dataframe, INSIGHT_PROMPTS, summary_key=None
+    )
+    assert analysis.result.startswith("## Principais insights e padrões\n\nanswer 0")
+    assert analysis.result.count("## ") == 5
+    assert "Principais insights" in analysis.prompt
+    assert analysis.cached is False
+    assert cache.set.call_count == 5
+
+
+def test_generate_insights_is_cached_when_every_section_is(sample_dataframe):
+    """Should skip GPT and flag the report as cached when all sections hit."""
+    openai_adapter = MagicMock()
+    cache = MagicMock()
+    cache.get.side_effect = lambda file_id, prompt: f"cached {INSIGHT_PROMPTS.index(prompt)}"
+    service = AnalyzerService(
+        openai_adapter=openai_adapter, cache_adapter=cache, drive_adapter=MagicMock()
+    )
+
+    analysis = service.generate_insights("sheet-1", "Sales")
+
+    openai_adapter.process_many.assert_not_called()
+    assert "cached 4" in analysis.result
+    assert analysis.cached is True
+
+
+def test_analyze_spreadsheet_uses_given_dataframe(sample_dataframe):
+    """Should analyze an already downloaded sheet without reading it from Drive."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+
+    cache.get.return_value = None
+    openai.process_data_with_gpt.return_value = "fresh answer"
 
-        service.generate_insights("sheet-1", "Sales", use_cache=False)
+    service = AnalyzerService(openai_adapter=openai, cache_adapter=cache, drive_adapter=drive)
+    analysis = service.analyze_spreadsheet("sheet-1", "Sales", "Explain", df=sample_dataframe)
 
-        called_prompt = analyze_mock.call_args[0][2]
-        assert "Principais insights" in called_prompt
-        assert analyze_mock.call_args[0][3] is False
+    assert analysis.result == "fresh answer"
+    drive.read_spreadsheet.assert_not_called()
+    assert openai.process_data_with_gpt.call_args.args[0] is sample_dataframe
 
 
 def test_clear_cache_returns_deleted_count():
     """Should delegate cache cleanup and return deleted count."""
     cache = MagicMock()
     cache.clear.return_value = 7
+    drive = MagicMock()
+    drive.clear_sheet_cache.return_value = 2
 
     service = AnalyzerService(
         openai_adapter=MagicMock(),
         cache_adapter=cache,
-        drive_adapter=MagicMock(),
+        drive_adapter=drive,
     )
 
     deleted = service.clear_cache()
 
-    assert deleted == 7
+    assert deleted == 9
     cache.clear.assert_called_once_with()
+    drive.clear_sheet_cache.assert_called_once_with()
+
+
+def test_analyze_many_sends_only_uncached_prompts(sample_dataframe):
+    """Should load data once and fan out only the prompts missing from cache."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+
+    cache.get.side_effect = lambda file_id, prompt: "cached" if prompt == "q1" else None
+    drive.read_spreadsheet.return_value = sample_dataframe
+    openai.process_many.return_value = ["answer 2", "answer 3"]
+
+    service = AnalyzerService(openai_adapter=openai, cache_adapter=cache, drive_adapter=drive)
+    analyses = service.analyze_many("sheet-1", "Sales", ["q1", "q2", "q3"])
+
+    assert [a.result for a in analyses] == ["cached", "answer 2", "answer 3"]
+    assert [a.cached for a in analyses] == [True, False, False]
+    drive.read_spreadsheet.assert_called_once_with("sheet-1", modified_time=None)
+    openai.process_many.assert_called_once_with(sample_dataframe, ["q2", "q3"], summary_key=None)
+    assert cache.set.call_count == 2
+
+
+def test_analyze_many_all_cached_skips_drive_and_openai():
+    """Should not touch Drive or OpenAI when every prompt is cached."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+
+    cache.get.return_value = "cached"
+
+    service = AnalyzerService(openai_adapter=openai, cache_adapter=cache, drive_adapter=drive)
+    analyses = service.analyze_many("sheet-1", "Sales", ["q1", "q2"])
+
+    assert all(a.cached for a in analyses)
+    drive.read_spreadsheet.assert_not_called()
+    openai.process_many.assert_not_called()
+
+
+def test_analyze_spreadsheet_semantic_cache_hit_skips_api_calls():
+    """Should answer from the semantic cache when a similar prompt was seen."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+    semantic = MagicMock()
+
+    cache.get.return_value = None
+    openai.embed_texts.return_value = [[0.1, 0.2]]
+    semantic.get.return_value = "similar answer"
+
+    service = AnalyzerService(
+        openai_adapter=openai,
+        cache_adapter=cache,
+        drive_adapter=drive,
+        semantic_cache=semantic,
+    )
+    analysis = service.analyze_spreadsheet(
+        "sheet-1", "Sales", "What's the average?", modified_time="2024-01-01T00:00:00.000Z"
+    )
+
+    assert analysis.cached is True
+    assert analysis.result == "similar answer"
+    semantic.get.assert_called_once_with("sheet-1", "2024-01-01T00:00:00.000Z", [0.1, 0.2])
+    drive.read_spreadsheet.assert_not_called()
+    openai.process_data_with_gpt.assert_not_called()
+
+
+def test_analyze_spreadsheet_semantic_cache_miss_stores_embedding(sample_dataframe):
+    """Should store fresh results with the embedding computed for the lookup."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+    semantic = MagicMock()
+
+    cache.get.return_value = None
+    drive.read_spreadsheet.return_value = sample_dataframe
+    openai.embed_texts.return_value = [[0.1, 0.2]]
+    openai.process_data_with_gpt.return_value = "fresh answer"
+    semantic.get.return_value = None
+
+    service = AnalyzerService(
+        openai_adapter=openai,
+        cache_adapter=cache,
+        drive_adapter=drive,
+        semantic_cache=semantic,
+    )
+    service.analyze_spreadsheet(
+        "sheet-1", "Sales", "Explain trends", modified_time="2024-01-01T00:00:00.000Z"
+    )
+
+    openai.embed_texts.assert_called_once_with(["Explain trends"])
+    semantic.set.assert_called_once_with(
+        "sheet-1", "2024-01-01T00:00:00.000Z", "Explain trends", [0.1, 0.2], "fresh answer"
+    )
+
+
+def test_analyze_spreadsheet_embedding_failure_falls_back_to_gpt(sample_dataframe):
+    """Should keep analyzing when the embedding call fails."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+    semantic = MagicMock()
+
+    cache.get.return_value = None
+    drive.read_spreadsheet.return_value = sample_dataframe
+    openai.embed_texts.side_effect = OpenAIError("embeddings down")
+    openai.process_data_with_gpt.return_value = "fresh answer"
+
+    service = AnalyzerService(
+        openai_adapter=openai,
+        cache_adapter=cache,
+        drive_adapter=drive,
+        semantic_cache=semantic,
+    )
+    analysis = service.analyze_spreadsheet(
+        "sheet-1", "Sales", "Explain trends", modified_time="2024-01-01T00:00:00.000Z"
+    )
+
+    assert analysis.result == "fresh answer"
+    semantic.get.assert_not_called()
+    semantic.set.assert_not_called()
+
+
+def test_analyze_many_embeds_cache_misses_in_one_call(sample_dataframe):
+    """Should embed every exact-cache miss in one request and reuse the vectors."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+    semantic = MagicMock()
+
+    prompts = [f"question {i}" for i in range(5)]
+    cache.get.side_effect = lambda _, prompt: "cached" if prompt == "question 0" else None
+    drive.read_spreadsheet.return_value = sample_dataframe
+    openai.embed_texts.return_value = [[float(i), 1.0] for i in range(1, 5)]
+    openai.process_many.return_value = ["a2", "a3", "a4"]
+    semantic.get.side_effect = [None, "similar", None, None]
+
+    service = AnalyzerService(
+        openai_adapter=openai,
+        cache_adapter=cache,
+        drive_adapter=drive,
+        semantic_cache=semantic,
+    )
+    analyses = service.analyze_many(
+        "sheet-1", "Sales", prompts, modified_time="2024-01-01T00:00:00.000Z"
+    )
+
+    assert [a.result for a in analyses] == ["cached", "a2", "similar", "a3", "a4"]
+    openai.embed_texts.assert_called_once_with(prompts[1:])
+    assert semantic.get.call_count == 4
+    assert [c.args[2:] for c in semantic.set.call_args_list] == [
+        ("question 1", [1.0, 1.0], "a2"),
+        ("question 3", [3.0, 1.0], "a3"),
+        ("question 4", [4.0, 1.0], "a4"),
+    ]
+
+
+def test_analyze_spreadsheet_skips_semantic_cache_without_revision(sample_dataframe):
+    """Should not match or store similar prompts when the sheet revision is unknown."""
+    openai = MagicMock()
+    cache = MagicMock()
+    drive = MagicMock()
+    semantic = MagicMock()
+
+    cache.get.return_value = None
+    drive.read_spreadsheet.return_value = sample_dataframe
+    openai.process_data_with_gpt.return_value = "fresh answer"
+
+    service = AnalyzerService(
+        openai_adapter=openai,
+        cache_adapter=cache,
+        drive_adapter=drive,
+        semantic_cache=semantic,
+    )
+    service.analyze_spreadsheet("sheet-1", "Sales", "Explain trends")
+
+    openai.embed_texts.assert_not_called()
+    semantic.get.assert_not_called()
+    semantic.set.assert_not_called()
+
+
+def test_generate_insights_repeats_across_calls_and_threads(openai_server, sample_dataframe):
+    """Should keep working for later calls, including from API worker threads."""
+    cache = MagicMock()
+    cache.get.return_value = None
+    drive = MagicMock()
+    drive.read_spreadsheet.return_value = sample_dataframe
+    service = AnalyzerService(
+        openai_adapter=OpenAIAdapter(api_key="test-key"),
+        cache_adapter=cache,
+        drive_adapter=drive,
+    )
+
+    service.generate_insights("sheet-1", "Sales")
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        reports = list(pool.map(lambda _: service.generate_insights("sheet-1", "Sales"), range(4)))
+
+    assert all(report.result.count("\n\nok") == len(INSIGHT_PROMPTS) for report in reports)
+
+
+def test_data_summary_is_reused_across_questions_about_one_revision(sample_dataframe):
+    """Should summarize an unchanged sheet once, although every read returns a new frame."""
+    openai_adapter = OpenAIAdapter(api_key="test-key")
+    openai_adapter.client = MagicMock()
+    openai_adapter.client.chat.completions.create.return_value.choices[0].message.content = "ok"
+    cache = MagicMock()
+    cache.get.return_value = None
+    drive = MagicMock()
+    drive.read_spreadsheet.side_effect = lambda *args, **kwargs: sample_dataframe.copy()
+    service = AnalyzerService(
+        openai_adapter=openai_adapter, cache_adapter=cache, drive_adapter=drive
+    )
+
+    with patch.object(
+        OpenAIAdapter, "_build_data_summary", wraps=openai_adapter._build_data_summary
+    ) as build:
+        for prompt in ["q1", "q2", "q3"]:
+            service.analyze_spreadsheet("sheet-1", "Sales", prompt, modified_time="rev-1")
+        assert build.call_count == 1
+
+        service.analyze_spreadsheet("sheet-1", "Sales", "q4", modified_time="rev-2")
+        service.analyze_spreadsheet("sheet-1", "Sales", "q5")
+        service.analyze_spreadsheet("sheet-1", "Sales", "q6")
+        assert build.call_count == 4
+
+
+def test_questions_about_one_revision_share_the_system_message(sample_dataframe):
+    """Should send a byte-identical system prefix, built once, for every question."""
+    openai_adapter = OpenAIAdapter(api_key="test-key")
+    openai_adapter.client = MagicMock()
+    create = openai_adapter.client.chat.completions.create
+    create.return_value.choices[0].message.content = "ok"
+    cache = MagicMock()
+    cache.get.return_value = None
+    drive = MagicMock()
+    drive.read_spreadsheet.side_effect = lambda *args, **kwargs: sample_dataframe.copy()
+    service = AnalyzerService(
+        openai_adapter=openai_adapter, cache_adapter=cache, drive_adapter=drive
+    )
+
+    with patch.object(
+        OpenAIAdapter, "_build_data_summary", wraps=openai_adapter._build_data_summary
+    ) as build:
+        service.analyze_spreadsheet("sheet-1", "Sales", "q-alpha", modified_time="rev-1")
+        service.analyze_spreadsheet("sheet-1", "Sales", "q-beta", modified_time="rev-1")
+
+    first, second = (c.kwargs["messages"] for c in create.call_args_list)
+    assert first[0] == second[0]
+    assert [first[1]["content"], second[1]["content"]] == ["q-alpha", "q-beta"]
+    assert build.call_count == 1
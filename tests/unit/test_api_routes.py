@@ -186,3 +186,24 @@ def test_clear_cache_success(client):
     assert response.status_code == 200
     payload = response.json()
     assert payload["cleared"] == 4
+
+
+def test_shutdown_closes_created_services(monkeypatch):
+    """Should close the Drive connections of the services built while serving."""
+    from functools import lru_cache
+
+    from src.api import dependencies
+
+    analyzer = MagicMock()
+    unused = MagicMock()
+    monkeypatch.setattr(
+        dependencies, "get_analyzer_service", lru_cache(maxsize=1)(lambda: analyzer)
+    )
+    monkeypatch.setattr(dependencies, "get_batch_service", lru_cache(maxsize=1)(lambda: unused))
+    dependencies.get_analyzer_service()
+
+    with TestClient(app):
+        pass
+
+    analyzer.close.assert_called_once_with()
+    unused.close.assert_not_called()
@@ -1,10 +1,10 @@
 """Tests for batch service."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from src.domain.exceptions import ApplicationError
+from src.domain.exceptions import ApplicationError, GoogleDriveError
 from src.domain.models import Analysis
 from src.services.batch import BatchService
 
@@ -89,6 +89,38 @@ def test_process_folder_keeps_processing_on_item_failure():
     assert "broken" in result[1]["error"]
 
 
+def test_process_folder_downloads_uncached_sheets_concurrently(sample_dataframe):
+    """Should download every uncached sheet in one concurrent read before analyzing."""
+    sheets = [
+        MagicMock(id="s1", name="Sheet A", modified_time="t1"),
+        MagicMock(id="s2", name="Sheet B", modified_time="t2"),
+        MagicMock(id="s3", name="Sheet C", modified_time="t3"),
+    ]
+
+    drive = MagicMock()
+    drive.list_spreadsheets.return_value = sheets
+    drive.aread_many = AsyncMock(return_value=[sample_dataframe, GoogleDriveError("429")])
+
+    analyzer = MagicMock()
+    analyzer.is_cached.side_effect = lambda file_id, _: file_id == "s2"
+    analyzer.analyze_spreadsheet.return_value = _analysis()
+
+    service = BatchService(
+        analyzer_service=analyzer, export_service=MagicMock(), drive_adapter=drive
+    )
+
+    result = service.process_folder("folder-1", "Prompt")
+
+    assert [r["status"] for r in result] == ["success"] * 3
+    drive.aread_many.assert_awaited_once_with(
+        ["s1", "s3"], modified_times=["t1", "t3"], return_exceptions=True
+    )
+    frames = [c.kwargs["df"] for c in analyzer.analyze_spreadsheet.call_args_list]
+    # The failed download is left to analyze_spreadsheet to read and report
+    assert frames[0] is sample_dataframe
+    assert frames[1] is None and frames[2] is None
+
+
 def test_process_folder_wraps_top_level_failures():
     """Should wrap top-level errors in ApplicationError."""
     drive = MagicMock()
@@ -140,3 +172,14 @@ def test_process_spreadsheets_records_export_error_and_continues():
     assert len(result) == 1
     assert result[0]["status"] == "success"
     assert "pdf error" in result[0]["export_error"]
+
+
+def test_close_releases_drive_connections():
+    """Should close its own Drive adapter and the analyzer's."""
+    analyzer = MagicMock()
+    drive = MagicMock()
+
+    BatchService(analyzer_service=analyzer, export_service=MagicMock(), drive_adapter=drive).close()
+
+    drive.close.assert_called_once_with()
+    analyzer.close.assert_called_once_with()
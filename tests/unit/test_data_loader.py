@@ -1,11 +1,12 @@
 """Tests for data loader service."""
 
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pandas as pd
 import pytest
 
 from src.domain.exceptions import ValidationError
+from src.domain.models import FileInfo
 from src.services.data_loader import DataLoaderService
 
 
@@ -36,7 +37,7 @@ def test_load_spreadsheet_success_returns_dataset(sample_dataframe):
     assert dataset.name == "Sales Sheet"
     assert dataset.shape == sample_dataframe.shape
     assert dataset.columns == list(sample_dataframe.columns)
-    drive.read_spreadsheet.assert_called_once_with("sheet-1", None)
+    drive.read_spreadsheet.assert_called_once_with("sheet-1", None, None)
 
 
 def test_load_spreadsheet_empty_dataframe_raises_validation_error():
@@ -67,3 +68,27 @@ def test_load_spreadsheet_wraps_unexpected_errors():
 
     with pytest.raises(ValidationError, match="Failed to load spreadsheet"):
         service.load_spreadsheet("sheet-1", "Broken Sheet")
+
+
+def test_load_spreadsheets_downloads_all_files_concurrently(sample_dataframe):
+    """Should read every file through the async adapter in one batch."""
+    drive = MagicMock()
+    drive.aread_many = AsyncMock(return_value=[sample_dataframe, sample_dataframe])
+    files = [
+        FileInfo(
+            id="s1",
+            name="Sheet A",
+            mimeType="application/vnd.google-apps.spreadsheet",
+            modifiedTime="2026-01-01T00:00:00Z",
+        ),
+        FileInfo(id="s2", name="Sheet B", mimeType="application/vnd.google-apps.spreadsheet"),
+    ]
+
+    service = DataLoaderService(drive_adapter=drive)
+    datasets = service.load_spreadsheets(files)
+
+    assert [d.id for d in datasets] == ["s1", "s2"]
+    assert all(d.shape == sample_dataframe.shape for d in datasets)
+    drive.aread_many.assert_awaited_once_with(
+        ["s1", "s2"], modified_times=["2026-01-01T00:00:00Z", None]
+    )
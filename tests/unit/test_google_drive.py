@@ -0,0 +1,570 @@
+"""Tests for Google Drive adapter."""
+
+import asyncio
+import io
+import json
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import httpx
+import pandas as pd
+import pytest
+from googleapiclient.errors import HttpError
+from tenacity import wait_none
+
+from src.adapters import google_drive
+from src.adapters.google_drive import GoogleDriveAdapter
+from src.domain.exceptions import GoogleDriveError
+
+
+@pytest.fixture
+def adapter(temp_cache_dir):
+    """Create an adapter with mocked credentials and Drive service."""
+    with patch.object(GoogleDriveAdapter, "_initialize"):
+        instance = GoogleDriveAdapter()
+    instance.creds = MagicMock(valid=True, token="test-token")
+    instance.service = MagicMock()
+    instance._cache_dir = temp_cache_dir / "sheets"
+    return instance
+
+
+def _mock_async_client(handler):
+    transport = httpx.MockTransport(handler)
+    client_class = httpx.AsyncClient
+    return patch.object(
+        httpx,
+        "AsyncClient",
+        side_effect=lambda **kwargs: client_class(transport=transport, **kwargs),
+    )
+
+
+def test_aread_many_exports_each_file_with_bearer_token(adapter, sample_dataframe):
+    """Should download every file via the CSV export endpoint and parse it."""
+    payload = sample_dataframe.to_csv(index=False).encode()
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        assert request.headers["Authorization"] == "Bearer test-token"
+        assert request.url.params["mimeType"] == "text/csv"
+        return httpx.Response(200, content=payload)
+
+    with _mock_async_client(handler):
+        frames = asyncio.run(adapter.aread_many(["s1", "s2"]))
+
+    assert sorted(requested) == ["/drive/v3/files/s1/export", "/drive/v3/files/s2/export"]
+    assert len(frames) == 2
+    pd.testing.assert_frame_equal(frames[0], sample_dataframe, check_dtype=False)
+
+
+def test_aread_many_keeps_sheet_cache_io_off_the_event_loop(adapter, sample_dataframe):
+    """Should read and write the Parquet sheet cache in worker threads."""
+    import threading
+
+    payload = sample_dataframe.to_csv(index=False).encode()
+    threads = {}
+    get_cached, set_cached = adapter._get_cached_sheet, adapter._set_cached_sheet
+
+    def record(name, func):
+        def wrapper(*args):
+            threads.setdefault(name, set()).add(threading.get_ident())
+            return func(*args)
+
+        return wrapper
+
+    adapter._get_cached_sheet = record("get", get_cached)
+    adapter._set_cached_sheet = record("set", set_cached)
+
+    with _mock_async_client(lambda request: httpx.Response(200, content=payload)):
+        asyncio.run(adapter.aread_many(["s1", "s2"], modified_times=["t1", "t2"]))
+        frames = asyncio.run(adapter.aread_many(["s1", "s2"], modified_times=["t1", "t2"]))
+
+    assert set(threads) == {"get", "set"}
+    assert threading.get_ident() not in threads["get"] | threads["set"]
+    assert len(frames[1]) == len(sample_dataframe)
+
+
+def test_aread_many_can_return_failed_reads(adapter, sample_dataframe):
+    """Should return a failed read's error in place of its frame when asked to."""
+    payload = sample_dataframe.to_csv(index=False).encode()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if "/s2/" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, content=payload)
+
+    with _mock_async_client(handler):
+        frames = asyncio.run(adapter.aread_many(["s1", "s2"], return_exceptions=True))
+
+    assert len(frames[0]) == len(sample_dataframe)
+    assert isinstance(frames[1], GoogleDriveError)
+
+
+def test_aread_spreadsheet_named_sheet_uses_xlsx_export(adapter, sample_dataframe):
+    """Should fall back to the XLSX export when a specific tab is requested."""
+    buffer = io.BytesIO()
+    sample_dataframe.to_excel(buffer, sheet_name="People", index=False, engine="openpyxl")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["mimeType"] == google_drive.XLSX_MIME_TYPE
+        return httpx.Response(200, content=buffer.getvalue())
+
+    with _mock_async_client(handler):
+        df = asyncio.run(adapter.aread_spreadsheet("s1", sheet_name="People"))
+
+    assert list(df.columns) == list(sample_dataframe.columns)
+
+
+def test_xlsx_export_format_keeps_typed_values(adapter, monkeypatch):
+    """Should read typed XLSX cells when SHEETS_EXPORT_FORMAT is xlsx."""
+    monkeypatch.setattr(google_drive.settings, "sheets_export_format", "xlsx")
+    typed = pd.DataFrame({"price": [1234.56, 10.0], "share": [0.12, 0.5]})
+    buffer = io.BytesIO()
+    typed.to_excel(buffer, index=False, engine="openpyxl")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["mimeType"] == google_drive.XLSX_MIME_TYPE
+        return httpx.Response(200, content=buffer.getvalue())
+
+    with _mock_async_client(handler):
+        df = asyncio.run(adapter.aread_spreadsheet("s1"))
+
+    assert df["price"].tolist() == [1234.56, 10.0]
+    assert df["share"].dtype.kind == "f"
+
+
+def test_parse_export_empty_csv_returns_empty_dataframe():
+    """Should treat an empty CSV export as an empty sheet."""
+    assert GoogleDriveAdapter._parse_export(b"").empty
+
+
+@pytest.mark.parametrize(
+    "csv, columns, dtypes",
+    [
+        (
+            b"Nome,,\nx,abc,1\ny,def,2\n",
+            ["Nome", "Unnamed: 1", "Unnamed: 2"],
+            ["string[pyarrow]", "string[pyarrow]", "int32[pyarrow]"],
+        ),
+        (
+            b"Nome,Total,Total\nx,1,abc\n",
+            ["Nome", "Total", "Total.1"],
+            ["string[pyarrow]", "int32[pyarrow]", "string[pyarrow]"],
+        ),
+    ],
+)
+def test_parse_export_renames_blank_and_repeated_headers(csv, columns, dtypes):
+    """Should give blank and repeated CSV headers unique pandas-style names."""
+    df = GoogleDriveAdapter._parse_export(csv)
+
+    assert list(df.columns) == columns
+    assert df.dtypes.astype(str).tolist() == dtypes
+
+
+def test_sheet_with_blank_headers_is_cached(adapter):
+    """Should keep blank-header sheets cacheable as Parquet."""
+    df = GoogleDriveAdapter._parse_export(b"Nome,,\nx,1,abc\n")
+
+    adapter._set_cached_sheet("s1", None, "2026-01-01", df)
+
+    cached = adapter._get_cached_sheet("s1", None, "2026-01-01")
+    assert list(cached.columns) == ["Nome", "Unnamed: 1", "Unnamed: 2"]
+
+
+def test_read_spreadsheet_falls_back_to_xlsx_when_csv_is_unparsable(adapter, sample_dataframe):
+    """Should re-export as XLSX when the CSV export cannot be parsed."""
+    buffer = io.BytesIO()
+    sample_dataframe.to_excel(buffer, index=False, engine="openpyxl")
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["mimeType"])
+        if request.url.params["mimeType"] == "text/csv":
+            return httpx.Response(200, content=b"a,b\n1,2,3\n")
+        return httpx.Response(200, content=buffer.getvalue())
+
+    _mock_http(adapter, handler)
+    df = adapter.read_spreadsheet("s1")
+
+    assert requested == ["text/csv", google_drive.XLSX_MIME_TYPE]
+    assert list(df.columns) == list(sample_dataframe.columns)
+
+
+def test_parse_export_narrows_whole_number_columns():
+    """Should store integer-valued columns within the int32 range as int32."""
+    csv = b"ints,whole,frac,big,name\n1,1.0,1.5,3000000000,x\n2,,2.5,1,y\n"
+
+    df = GoogleDriveAdapter._parse_export(csv)
+
+    assert df.dtypes.astype(str).to_dict() == {
+        "ints": "int32[pyarrow]",
+        "whole": "int32[pyarrow]",
+        "frac": "double[pyarrow]",
+        "big": "int64[pyarrow]",
+        "name": "string[pyarrow]",
+    }
+    assert df["whole"].isna().tolist() == [False, True]
+
+
+def test_aread_spreadsheet_http_error_raises_google_drive_error(adapter):
+    """Should wrap HTTP failures in GoogleDriveError."""
+    with _mock_async_client(lambda request: httpx.Response(404)):
+        with pytest.raises(GoogleDriveError, match="Failed to read spreadsheet"):
+            asyncio.run(adapter.aread_spreadsheet("missing"))
+
+
+def test_access_token_refreshes_expired_credentials(adapter):
+    """Should refresh credentials before handing out a token."""
+    adapter.creds.valid = False
+
+    token = adapter._access_token()
+
+    adapter.creds.refresh.assert_called_once()
+    assert token == "test-token"
+
+
+def test_parse_workbook_selects_first_or_named_sheet(sample_dataframe):
+    """Should return the first sheet by default and the named one on request."""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        sample_dataframe.to_excel(writer, sheet_name="People", index=False)
+        pd.DataFrame({"Total": [1, 2]}).to_excel(writer, sheet_name="Totals", index=False)
+    data = buffer.getvalue()
+
+    first = GoogleDriveAdapter._parse_workbook(io.BytesIO(data))
+    named = GoogleDriveAdapter._parse_workbook(io.BytesIO(data), "Totals")
+
+    assert list(first.columns) == list(sample_dataframe.columns)
+    assert list(named.columns) == ["Total"]
+
+
+def test_aread_spreadsheet_reuses_cached_sheet_for_same_revision(adapter, sample_dataframe):
+    """Should download once per modifiedTime and serve repeats from disk."""
+    payload = sample_dataframe.to_csv(index=False).encode()
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, content=payload)
+
+    with _mock_async_client(handler):
+        first = asyncio.run(adapter.aread_spreadsheet("s1", modified_time="2026-01-01"))
+        second = asyncio.run(adapter.aread_spreadsheet("s1", modified_time="2026-01-01"))
+        asyncio.run(adapter.aread_spreadsheet("s1", modified_time="2026-02-01"))
+
+    assert len(calls) == 2
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_sheet_cache_keeps_only_latest_revision(adapter, sample_dataframe):
+    """Should drop older revisions of a sheet when a new one is cached."""
+    adapter._set_cached_sheet("s1", None, "2026-01-01", sample_dataframe)
+    adapter._set_cached_sheet("s2", None, "2026-01-01", sample_dataframe)
+    adapter._set_cached_sheet("s1", None, "2026-02-01", sample_dataframe)
+
+    assert len(list(adapter._cache_dir.glob("*.parquet"))) == 2
+    assert adapter._get_cached_sheet("s1", None, "2026-01-01") is None
+    assert adapter._get_cached_sheet("s1", None, "2026-02-01") is not None
+    assert adapter._get_cached_sheet("s2", None, "2026-01-01") is not None
+
+
+def test_clear_sheet_cache_deletes_every_cached_sheet(adapter, sample_dataframe):
+    """Should remove all cached sheets and report how many there were."""
+    adapter._set_cached_sheet("s1", None, "2026-01-01", sample_dataframe)
+    adapter._set_cached_sheet("s1", "People", "2026-01-01", sample_dataframe)
+
+    assert adapter.clear_sheet_cache() == 2
+    assert adapter.clear_sheet_cache() == 0
+
+
+def test_read_spreadsheet_without_modified_time_skips_cache(adapter, sample_dataframe):
+    """Should not cache reads whose revision is unknown."""
+    adapter._set_cached_sheet("s1", None, None, sample_dataframe)
+
+    assert adapter._get_cached_sheet("s1", None, None) is None
+    assert not adapter._cache_dir.exists()
+
+
+def _listing(*file_ids):
+    return {
+        "files": [
+            {"id": file_id, "name": file_id, "mimeType": "application/vnd.google-apps.spreadsheet"}
+            for file_id in file_ids
+        ]
+    }
+
+
+def _mock_http(adapter, handler):
+    """Route the adapter's shared sync connection through a mock transport."""
+    adapter._http = httpx.Client(
+        base_url=google_drive.DRIVE_API_URL, transport=httpx.MockTransport(handler)
+    )
+
+
+def test_shared_http_client_is_opened_once_across_threads(adapter):
+    """Should hand every concurrent caller the same client, and reopen it after close."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with patch.object(httpx, "Client", side_effect=lambda **_: MagicMock()) as client_class:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: adapter._http_client(), range(32)))
+
+        assert client_class.call_count == 1
+        assert all(client is clients[0] for client in clients)
+
+        adapter.close()
+        clients[0].close.assert_called_once_with()
+        assert adapter._http is None
+        assert adapter._http_client() is not clients[0]
+
+
+def _serve_listing(adapter, *pages):
+    """Answer files.list calls with the given pages and record the requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == google_drive.FILES_URL
+        assert request.headers["Authorization"] == "Bearer test-token"
+        requests.append(request)
+        return httpx.Response(200, json=pages[min(len(requests), len(pages)) - 1])
+
+    _mock_http(adapter, handler)
+    return requests
+
+
+def test_list_spreadsheets_reuses_recent_listing(adapter):
+    """Should answer repeated listings of the same folder from memory."""
+    requests = _serve_listing(adapter, _listing("s1", "s2"))
+
+    first = adapter.list_spreadsheets("folder-1")
+    second = adapter.list_spreadsheets("folder-1")
+
+    assert [f.id for f in second] == [f.id for f in first] == ["s1", "s2"]
+    assert len(requests) == 1
+    assert "'folder-1' in parents" in requests[0].url.params["q"]
+
+
+def test_list_spreadsheets_follows_next_page_token(adapter):
+    """Should keep requesting pages until Drive stops returning a token."""
+    first_page = {**_listing("s1", "s2"), "nextPageToken": "page-2"}
+    requests = _serve_listing(adapter, first_page, _listing("s3"))
+
+    files = adapter.list_spreadsheets()
+
+    assert [f.id for f in files] == ["s1", "s2", "s3"]
+    assert [r.url.params.get("pageToken") for r in requests] == [None, "page-2"]
+    assert all(r.url.params["pageSize"] == str(google_drive.LIST_PAGE_SIZE) for r in requests)
+
+
+def test_list_spreadsheets_refetches_other_folder_or_after_ttl(adapter):
+    """Should hit Drive again for another folder or once the TTL expired."""
+    requests = _serve_listing(adapter, _listing("s1"))
+
+    with patch.object(google_drive.time, "monotonic", return_value=1000.0):
+        adapter.list_spreadsheets("folder-1")
+        adapter.list_spreadsheets("folder-2")
+
+    ttl = google_drive.LIST_CACHE_TTL_SECONDS
+    with patch.object(google_drive.time, "monotonic", return_value=1000.0 + ttl):
+        adapter.list_spreadsheets("folder-2")
+
+    assert len(requests) == 3
+
+
+def test_read_spreadsheet_exports_over_shared_connection(adapter, sample_dataframe):
+    """Should export through the shared client, reusing it across calls."""
+    payload = sample_dataframe.to_csv(index=False).encode()
+    paths = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        assert request.url.params["mimeType"] == "text/csv"
+        return httpx.Response(200, content=payload)
+
+    _mock_http(adapter, handler)
+    client = adapter._http
+
+    df = adapter.read_spreadsheet("s1")
+    adapter.read_spreadsheet("s2")
+
+    assert adapter._http is client
+    assert paths == ["/drive/v3/files/s1/export", "/drive/v3/files/s2/export"]
+    pd.testing.assert_frame_equal(df, sample_dataframe, check_dtype=False)
+
+
+def test_read_spreadsheet_http_error_raises_google_drive_error(adapter):
+    """Should wrap export failures in GoogleDriveError."""
+    _mock_http(adapter, lambda request: httpx.Response(403))
+
+    with pytest.raises(GoogleDriveError, match="Failed to read spreadsheet"):
+        adapter.read_spreadsheet("s1")
+
+
+class _FakeBatch:
+    """Stand-in for googleapiclient's BatchHttpRequest."""
+
+    def __init__(self, callback, responses):
+        self.callback = callback
+        self.responses = responses
+        self.request_ids = []
+
+    def add(self, request, request_id):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            response = self.responses[request_id]
+            if isinstance(response, list):
+                # One response per attempt
+                response = response.pop(0)
+            if isinstance(response, Exception):
+                self.callback(request_id, None, response)
+            else:
+                self.callback(request_id, response, None)
+
+
+def _batching(adapter, responses):
+    batches = []
+
+    def new_batch(callback):
+        batches.append(_FakeBatch(callback, responses))
+        return batches[-1]
+
+    adapter.service.new_batch_http_request.side_effect = new_batch
+    return batches
+
+
+def test_get_file_infos_chunks_batch_requests(adapter):
+    """Should fetch every file through batches of at most BATCH_MAX_REQUESTS."""
+    file_ids = [f"s{i}" for i in range(google_drive.BATCH_MAX_REQUESTS + 5)]
+    batches = _batching(adapter, {fid: _listing(fid)["files"][0] for fid in file_ids})
+
+    infos = adapter.get_file_infos(file_ids + ["s0"])
+
+    assert list(infos) == file_ids
+    assert infos["s3"].name == "s3"
+    assert [len(b.request_ids) for b in batches] == [google_drive.BATCH_MAX_REQUESTS, 5]
+
+
+def test_get_file_infos_reports_failed_lookups(adapter):
+    """Should raise GoogleDriveError naming the files that failed."""
+    _batching(adapter, {"s1": _listing("s1")["files"][0], "s2": RuntimeError("not found")})
+
+    with pytest.raises(GoogleDriveError, match="s2: not found"):
+        adapter.get_file_infos(["s1", "s2"])
+
+
+@pytest.fixture
+def no_backoff():
+    """Retry transient Drive errors without sleeping."""
+    with (
+        patch.object(GoogleDriveAdapter._get.retry, "wait", wait_none()),
+        patch.object(GoogleDriveAdapter._aget.retry, "wait", wait_none()),
+        patch.object(GoogleDriveAdapter._batch_file_infos.retry, "wait", wait_none()),
+    ):
+        yield
+
+
+def _http_error(status: int, reason: str = "backendError") -> HttpError:
+    content = json.dumps({"error": {"errors": [{"reason": reason}], "message": reason}})
+    return HttpError(httplib2.Response({"status": status}), content.encode())
+
+
+def test_get_file_infos_rebatches_transient_failures(adapter, no_backoff):
+    """Should batch again only the lookups that hit a rate limit or 5xx."""
+    s1, s2, s3 = (_listing(fid)["files"][0] for fid in ("s1", "s2", "s3"))
+    batches = _batching(
+        adapter,
+        {
+            "s1": s1,
+            "s2": [_http_error(503), _http_error(403, "rateLimitExceeded"), s2],
+            "s3": [_http_error(429), s3],
+        },
+    )
+
+    infos = adapter.get_file_infos(["s1", "s2", "s3"])
+
+    assert list(infos) == ["s1", "s2", "s3"]
+    assert [b.request_ids for b in batches] == [["s1", "s2", "s3"], ["s2", "s3"], ["s2"]]
+
+
+def test_get_file_infos_does_not_retry_permanent_failures(adapter, no_backoff):
+    """Should report a 404 lookup at once and keep retrying nothing else."""
+    batches = _batching(
+        adapter, {"s1": _listing("s1")["files"][0], "s2": [_http_error(404, "notFound")]}
+    )
+
+    with pytest.raises(GoogleDriveError, match="s2: "):
+        adapter.get_file_infos(["s1", "s2"])
+
+    assert len(batches) == 1
+
+
+def test_get_file_infos_reports_lookups_still_failing_after_retries(adapter, no_backoff):
+    """Should name the files that kept failing once MAX_ATTEMPTS is reached."""
+    batches = _batching(
+        adapter,
+        {"s1": _listing("s1")["files"][0], "s2": [_http_error(500)] * google_drive.MAX_ATTEMPTS},
+    )
+
+    with pytest.raises(GoogleDriveError, match="s2: "):
+        adapter.get_file_infos(["s1", "s2"])
+
+    assert len(batches) == google_drive.MAX_ATTEMPTS
+
+
+def test_read_spreadsheet_retries_transient_errors(adapter, sample_dataframe, no_backoff):
+    """Should retry 5xx responses and succeed once Drive recovers."""
+    responses = [httpx.Response(503), httpx.Response(500)]
+    payload = sample_dataframe.to_csv(index=False).encode()
+    _mock_http(
+        adapter,
+        lambda request: responses.pop(0) if responses else httpx.Response(200, content=payload),
+    )
+
+    df = adapter.read_spreadsheet("s1")
+
+    assert not responses
+    assert len(df) == len(sample_dataframe)
+
+
+def test_aread_spreadsheet_gives_up_after_max_attempts(adapter, no_backoff):
+    """Should stop retrying after MAX_ATTEMPTS and raise GoogleDriveError."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429)
+
+    with _mock_async_client(handler):
+        with pytest.raises(GoogleDriveError, match="429"):
+            asyncio.run(adapter.aread_spreadsheet("s1"))
+
+    assert len(calls) == google_drive.MAX_ATTEMPTS
+
+
+@pytest.mark.parametrize(
+    ("response", "expected"),
+    [
+        (
+            httpx.Response(403, json={"error": {"errors": [{"reason": "userRateLimitExceeded"}]}}),
+            True,
+        ),
+        (
+            httpx.Response(
+                403, json={"error": {"errors": [{"reason": "insufficientFilePermissions"}]}}
+            ),
+            False,
+        ),
+        (httpx.Response(403, text="forbidden"), False),
+        (httpx.Response(404), False),
+        (httpx.Response(502), True),
+    ],
+)
+def test_is_transient_classifies_drive_errors(response, expected):
+    """Should only retry rate limits, server errors and network failures."""
+    response.request = httpx.Request("GET", google_drive.DRIVE_API_URL)
+    error = httpx.HTTPStatusError("error", request=response.request, response=response)
+
+    assert google_drive._is_transient(error) is expected
+    assert google_drive._is_transient(httpx.ConnectError("down")) is True
@@ -0,0 +1,211 @@
+"""Tests for OpenAI adapter."""
+
+import json
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from src.adapters import openai_client
+from src.adapters.openai_client import OpenAIAdapter
+from src.domain.exceptions import OpenAIError
+
+
+def _completion(content: str) -> MagicMock:
+    response = MagicMock()
+    response.choices[0].message.content = content
+    return response
+
+
+@pytest.fixture
+def adapter():
+    """Create an adapter with mocked OpenAI clients."""
+    instance = OpenAIAdapter(api_key="test-key")
+    instance.client = MagicMock()
+    # One mock client stands in for every client _async_client would open
+    instance.async_client = MagicMock()
+    instance.async_client.__aenter__.return_value = instance.async_client
+    instance._async_client = MagicMock(return_value=instance.async_client)
+    return instance
+
+
+def test_process_data_with_gpt_returns_message_content(adapter, sample_dataframe):
+    """Should return the completion content from the sync client."""
+    adapter.client.chat.completions.create.return_value = _completion("sync answer")
+
+    result = adapter.process_data_with_gpt(sample_dataframe, "Explain trends")
+
+    assert result == "sync answer"
+    messages = adapter.client.chat.completions.create.call_args.kwargs["messages"]
+    assert "Explain trends" in messages[-1]["content"]
+
+
+def test_messages_keep_data_in_a_shared_system_prefix(adapter, sample_dataframe):
+    """Should send the data summary in the system message and only the question as user."""
+    adapter.client.chat.completions.create.return_value = _completion("ok")
+
+    adapter.process_data_with_gpt(sample_dataframe, "q-alpha")
+    adapter.process_data_with_gpt(sample_dataframe, "q-beta")
+
+    first, second = (
+        c.kwargs["messages"] for c in adapter.client.chat.completions.create.call_args_list
+    )
+    assert first[0] == second[0]
+    assert first[0]["content"].endswith(adapter.prepare_data_summary(sample_dataframe) + "\n")
+    assert [first[1], second[1]] == [
+        {"role": "user", "content": "q-alpha"},
+        {"role": "user", "content": "q-beta"},
+    ]
+
+
+def test_process_many_preserves_prompt_order(adapter, sample_dataframe):
+    """Should send every prompt through the async client and keep order."""
+
+    prompts = ["q-alpha", "q-beta", "q-gamma"]
+
+    async def create(**kwargs):
+        content = kwargs["messages"][-1]["content"]
+        return _completion(next(f"answer to {p}" for p in prompts if p in content))
+
+    adapter.async_client.chat.completions.create = AsyncMock(side_effect=create)
+
+    results = adapter.process_many(sample_dataframe, prompts)
+
+    assert results == ["answer to q-alpha", "answer to q-beta", "answer to q-gamma"]
+    assert adapter.async_client.chat.completions.create.await_count == 3
+
+
+def test_process_many_wraps_errors_as_openai_error(adapter, sample_dataframe):
+    """Should surface API failures as OpenAIError."""
+    adapter.async_client.chat.completions.create = AsyncMock(side_effect=RuntimeError("down"))
+
+    with pytest.raises(OpenAIError, match="Failed to process with GPT"):
+        adapter.process_many(sample_dataframe, ["first", "second"])
+
+
+def test_process_data_with_gpt_streams_tokens_to_callback(adapter, sample_dataframe):
+    """Should stream deltas to on_token and return the joined text."""
+    chunks = []
+    for text in ["Olá", None, ", mundo"]:
+        chunk = MagicMock()
+        chunk.choices[0].delta.content = text
+        chunks.append(chunk)
+    adapter.client.chat.completions.create.return_value = iter(chunks)
+    received = []
+
+    result = adapter.process_data_with_gpt(sample_dataframe, "Hi", on_token=received.append)
+
+    assert result == "Olá, mundo"
+    assert received == ["Olá", ", mundo"]
+    assert adapter.client.chat.completions.create.call_args.kwargs["stream"] is True
+
+
+def test_prepare_data_summary_lists_dtypes_sample_and_stats(adapter, sample_dataframe):
+    """Should include shape, one line per dtype, the sample and numeric stats."""
+    summary = adapter.prepare_data_summary(sample_dataframe)
+
+    assert summary.startswith("Dataset Info:\n- Shape: 3 rows, 4 columns\n")
+    assert "\n\nData Types:\n- Name: object\n- Age: int64\n" in summary
+    assert "\n\nSample Data (first 3 rows):\n" in summary
+    assert "\n\nNumeric Statistics:\n" in summary
+    assert not summary.endswith("\n")
+
+
+def test_analyze_data_structure_counts_nulls_for_numpy_and_arrow_columns(adapter):
+    """Should report the same null counts for NumPy- and Arrow-backed frames."""
+    df = pd.DataFrame({"Name": ["A", None, "C"], "Age": [1.0, None, None]})
+    arrow_df = df.convert_dtypes(dtype_backend="pyarrow")
+
+    numpy_info = json.loads(adapter.analyze_data_structure(df))
+    arrow_info = json.loads(adapter.analyze_data_structure(arrow_df))
+
+    assert numpy_info["null_counts"] == arrow_info["null_counts"] == {"Name": 1, "Age": 2}
+    assert arrow_info["dtypes"]["Age"] == "int64[pyarrow]"
+
+
+def test_process_many_builds_summary_once(adapter, sample_dataframe):
+    """Should build the data summary once and share it across all prompts."""
+    adapter.async_client.chat.completions.create = AsyncMock(return_value=_completion("ok"))
+
+    with patch.object(
+        OpenAIAdapter, "_build_data_summary", autospec=True, return_value="<summary>"
+    ) as build:
+        adapter.process_many(sample_dataframe, ["q-alpha", "q-beta", "q-gamma"])
+
+    build.assert_called_once()
+    calls = adapter.async_client.chat.completions.create.call_args_list
+    assert all("<summary>" in c.kwargs["messages"][0]["content"] for c in calls)
+
+
+def test_describe_numeric_matches_pandas_describe():
+    """Should produce the same statistics as DataFrame.describe()."""
+    df = pd.DataFrame(
+        {
+            "a": [1.0, 2.0, None, 4.0, 10.0],
+            "b": [5, 3, 1, 2, 2],
+            "c": [None, None, None, None, 7.5],
+        }
+    )
+
+    pd.testing.assert_frame_equal(OpenAIAdapter._describe_numeric(df), df.describe())
+
+
+def test_prepare_data_summary_handles_numeric_sheet_without_rows(adapter):
+    """Should summarize a numeric frame with no rows like describe() does."""
+    df = pd.DataFrame({"x": [1, 2]}).iloc[0:0]
+
+    pd.testing.assert_frame_equal(OpenAIAdapter._describe_numeric(df), df.describe())
+    assert "Numeric Statistics:" in adapter.prepare_data_summary(df)
+
+
+def test_describe_numeric_handles_arrow_backed_columns():
+    """Should treat Arrow nulls as missing values."""
+    df = pd.DataFrame({"a": [1.0, None, 3.0]}).convert_dtypes(dtype_backend="pyarrow")
+
+    stats = OpenAIAdapter._describe_numeric(df)
+
+    assert stats.loc["count", "a"] == 2
+    assert stats.loc["mean", "a"] == 2.0
+
+
+def test_prepare_data_summary_memo_is_bounded(adapter, sample_dataframe):
+    """Should keep only the SUMMARY_CACHE_SIZE most recently used revisions."""
+    with patch.object(openai_client, "SUMMARY_CACHE_SIZE", 2):
+        for revision in ["rev-1", "rev-2", "rev-1", "rev-3"]:
+            adapter.prepare_data_summary(sample_dataframe, summary_key=("s1", revision))
+
+    assert [key for key, _ in adapter._summary_cache] == [("s1", "rev-1"), ("s1", "rev-3")]
+
+
+def test_prepare_data_summary_samples_large_frames(adapter):
+    """Should describe a sample of the rows above SUMMARY_SAMPLE_ROWS."""
+    df = pd.DataFrame({"value": range(50)})
+
+    with patch.object(openai_client, "SUMMARY_SAMPLE_ROWS", 10):
+        summary = adapter.prepare_data_summary(df)
+
+    assert "- Shape: 50 rows, 1 columns" in summary
+    assert "Numeric Statistics (sample of 10 of 50 rows):" in summary
+    assert re.search(r"^count +10\.0+$", summary, re.MULTILINE)
+
+
+def test_process_many_can_run_repeatedly_on_one_adapter(openai_server, sample_dataframe):
+    """Should not reuse connections bound to the event loop of an earlier call."""
+    adapter = OpenAIAdapter(api_key="test-key")
+
+    for _ in range(3):
+        assert adapter.process_many(sample_dataframe, ["q-alpha", "q-beta"]) == ["ok", "ok"]
+
+
+def test_embed_texts_sends_one_request_and_keeps_input_order(adapter):
+    """Should embed all texts in one call and order vectors by their input index."""
+    first, second = MagicMock(index=0, embedding=[1.0]), MagicMock(index=1, embedding=[2.0])
+    adapter.client.embeddings.create.return_value = MagicMock(data=[second, first])
+
+    vectors = adapter.embed_texts(["a", "b"])
+
+    assert vectors == [[1.0], [2.0]]
+    adapter.client.embeddings.create.assert_called_once_with(
+        model=openai_client.EMBEDDING_MODEL, input=["a", "b"]
+    )
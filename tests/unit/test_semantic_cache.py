@@ -0,0 +1,134 @@
+"""Tests for semantic cache adapter."""
+
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.adapters.semantic_cache import SemanticCacheAdapter
+
+REVISION = "2024-01-01T00:00:00.000Z"
+
+
+@pytest.fixture
+def cache_dir():
+    """Create a temporary base cache directory."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield tmpdir
+
+
+@pytest.fixture
+def semantic_cache(cache_dir):
+    """Create a semantic cache with temporary directory."""
+    return SemanticCacheAdapter(cache_dir=cache_dir, threshold=0.95)
+
+
+def test_semantic_cache_hit_for_similar_embedding(semantic_cache):
+    """Test that a near-identical embedding returns the cached result."""
+    semantic_cache.set("sheet-123", REVISION, "What is the average?", [1.0, 0.0, 0.0], "42")
+
+    assert semantic_cache.get("sheet-123", REVISION, [0.99, 0.05, 0.0]) == "42"
+
+
+def test_semantic_cache_miss_below_threshold(semantic_cache):
+    """Test that dissimilar embeddings do not match."""
+    semantic_cache.set("sheet-123", REVISION, "What is the average?", [1.0, 0.0, 0.0], "42")
+
+    assert semantic_cache.get("sheet-123", REVISION, [0.0, 1.0, 0.0]) is None
+
+
+def test_semantic_cache_scoped_per_spreadsheet(semantic_cache):
+    """Test that entries from another spreadsheet are never returned."""
+    semantic_cache.set("sheet-123", REVISION, "What is the average?", [1.0, 0.0, 0.0], "42")
+
+    assert semantic_cache.get("sheet-456", REVISION, [1.0, 0.0, 0.0]) is None
+
+
+def test_semantic_cache_scoped_per_revision(cache_dir, semantic_cache):
+    """Test that a new revision never sees, and then drops, older answers."""
+    semantic_cache.set("sheet-123", REVISION, "What is the average?", [1.0, 0.0, 0.0], "42")
+    semantic_cache.set("sheet-456", REVISION, "What is the average?", [1.0, 0.0, 0.0], "7")
+
+    new_revision = "2024-02-01T00:00:00.000Z"
+    assert semantic_cache.get("sheet-123", new_revision, [1.0, 0.0, 0.0]) is None
+
+    semantic_cache.set("sheet-123", new_revision, "What is the total?", [0.0, 1.0, 0.0], "99")
+
+    reloaded = SemanticCacheAdapter(cache_dir=cache_dir, threshold=0.95)
+    assert reloaded.get("sheet-123", REVISION, [1.0, 0.0, 0.0]) is None
+    assert reloaded.get("sheet-123", new_revision, [0.0, 1.0, 0.0]) == "99"
+    assert reloaded.get("sheet-456", REVISION, [1.0, 0.0, 0.0]) == "7"
+
+
+def test_semantic_cache_returns_best_match(semantic_cache):
+    """Test that the most similar prompt wins."""
+    semantic_cache.set("sheet-123", REVISION, "prompt-a", [1.0, 0.0, 0.0], "result-a")
+    semantic_cache.set("sheet-123", REVISION, "prompt-b", [0.0, 1.0, 0.0], "result-b")
+
+    assert semantic_cache.get("sheet-123", REVISION, [0.02, 1.0, 0.0]) == "result-b"
+
+
+def test_semantic_cache_persists_between_instances(cache_dir, semantic_cache):
+    """Test that entries are reloaded from disk."""
+    semantic_cache.set("sheet-123", REVISION, "What is the average?", [1.0, 0.0, 0.0], "42")
+
+    reloaded = SemanticCacheAdapter(cache_dir=cache_dir, threshold=0.95)
+
+    assert reloaded.get("sheet-123", REVISION, [1.0, 0.0, 0.0]) == "42"
+
+
+def test_semantic_cache_clear(cache_dir, semantic_cache):
+    """Test clearing all entries, in memory and on disk."""
+    for i in range(3):
+        semantic_cache.set(f"sheet-{i}", REVISION, "prompt", [1.0, float(i), 0.0], f"result-{i}")
+
+    assert semantic_cache.clear() == 3
+    assert semantic_cache.get("sheet-0", REVISION, [1.0, 0.0, 0.0]) is None
+    assert (
+        SemanticCacheAdapter(cache_dir=cache_dir).get("sheet-0", REVISION, [1.0, 0.0, 0.0]) is None
+    )
+
+
+def test_semantic_cache_concurrent_sets_keep_entries_aligned(cache_dir, semantic_cache):
+    """Test that concurrent writers never lose entries or mismatch embeddings."""
+
+    def store(i):
+        embedding = [0.0] * 64
+        embedding[i] = 1.0
+        semantic_cache.set("sheet-123", REVISION, f"prompt-{i}", embedding, f"result-{i}")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(store, range(64)))
+
+    reloaded = SemanticCacheAdapter(cache_dir=cache_dir, threshold=0.95)
+    for cache in (semantic_cache, reloaded):
+        for i in range(64):
+            embedding = [0.0] * 64
+            embedding[i] = 1.0
+            assert cache.get("sheet-123", REVISION, embedding) == f"result-{i}"
+
+
+def test_semantic_cache_appends_one_line_per_entry(cache_dir, semantic_cache):
+    """Test that storing a result appends to the index instead of rewriting it."""
+    semantic_cache.set("sheet-123", REVISION, "prompt-a", [1.0, 0.0, 0.0], "result-a")
+    size = semantic_cache.cache_file.stat().st_size
+
+    semantic_cache.set("sheet-123", REVISION, "prompt-b", [0.0, 1.0, 0.0], "result-b")
+
+    lines = semantic_cache.cache_file.read_text().splitlines()
+    assert len(lines) == 2
+    assert semantic_cache.cache_file.stat().st_size > size
+
+
+def test_semantic_cache_skips_torn_line(cache_dir, semantic_cache):
+    """Test that a partially written last line does not discard the index."""
+    semantic_cache.set("sheet-123", REVISION, "prompt-a", [1.0, 0.0, 0.0], "result-a")
+    with open(semantic_cache.cache_file, "a") as f:
+        f.write('{"spreadsheet_id": "sheet-1')
+
+    reloaded = SemanticCacheAdapter(cache_dir=cache_dir, threshold=0.95)
+    reloaded.set("sheet-123", REVISION, "prompt-b", [0.0, 1.0, 0.0], "result-b")
+
+    again = SemanticCacheAdapter(cache_dir=cache_dir, threshold=0.95)
+    assert again.get("sheet-123", REVISION, [1.0, 0.0, 0.0]) == "result-a"
+    assert again.get("sheet-123", REVISION, [0.0, 1.0, 0.0]) == "result-b"